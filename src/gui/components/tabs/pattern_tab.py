@@ -13,10 +13,16 @@ def _build_pattern_tab(parent: ctk.CTkFrame, state, context) -> None:
     if not state or not hasattr(state, "pattern") or not state.pattern:
         logging.warning("Invalid state for pattern tab, using defaults")
         # Could set defaults, but for now, just proceed assuming it's ok
-    if not isinstance(state.pattern.mask, list) or len(state.pattern.mask) != 12:
+    if (
+        not isinstance(state.pattern.mask, (list, tuple))
+        or len(state.pattern.mask) != 12
+    ):
         logging.warning("Invalid pattern mask, resetting to all True")
         state.pattern.mask = [True] * 12
-    if not isinstance(state.pattern.accents, list) or len(state.pattern.accents) != 12:
+    if (
+        not isinstance(state.pattern.accents, (list, tuple))
+        or len(state.pattern.accents) != 12
+    ):
         logging.warning("Invalid pattern accents, resetting to all False")
         state.pattern.accents = [False] * 12
 
@@ -59,11 +65,13 @@ def _build_pattern_tab(parent: ctk.CTkFrame, state, context) -> None:
 
     def refresh_ui():
         """Refresh UI elements to match current state."""
+        mask = state.pattern.mask
+        accents = state.pattern.accents
         for i, btn in enumerate(buttons):
             btn.configure(
                 fg_color=(
                     theme.BACKGROUND_SELECTED
-                    if state.pattern.mask[i]
+                    if mask[i]
                     else (
                         theme.BACKGROUND_UNSELECTED,
                         theme.BACKGROUND_UNSELECTED,
@@ -75,7 +83,7 @@ def _build_pattern_tab(parent: ctk.CTkFrame, state, context) -> None:
             btn.configure(
                 fg_color=(
                     theme.BACKGROUND_SELECTED
-                    if state.pattern.accents[i]
+                    if accents[i]
                     else (theme.BACKGROUND_UNSELECTED, theme.BACKGROUND_UNSELECTED)
                 ),
                 text_color=theme.FONT_AND_BORDER,
@@ -95,7 +103,7 @@ def _build_pattern_tab(parent: ctk.CTkFrame, state, context) -> None:
 
     def make_toggle(i: int):
         def _toggle():
-            state.pattern.mask[i] = not state.pattern.mask[i]
+            state.pattern.mask_bits ^= 1 << i
             # Update pattern notes when mask changes
             if context.processor:
                 context.processor._update_arp_pattern()
@@ -105,7 +113,7 @@ def _build_pattern_tab(parent: ctk.CTkFrame, state, context) -> None:
 
     def make_accent_toggle(i: int):
         def _toggle():
-            state.pattern.accents[i] = not state.pattern.accents[i]
+            state.pattern.accent_bits ^= 1 << i
             refresh_ui()
 
         return _toggle
@@ -117,13 +125,14 @@ def _build_pattern_tab(parent: ctk.CTkFrame, state, context) -> None:
         grid_frame.grid_rowconfigure(r, weight=1, uniform="row")
 
     # Step buttons
+    mask = state.pattern.mask
     for r in range(3):
         for c in range(4):
             idx = r * 4 + c
             text = str(idx + 1)
             fg = (
                 theme.BACKGROUND_SELECTED
-                if state.pattern.mask[idx]
+                if mask[idx]
                 else (
                     theme.BACKGROUND_UNSELECTED,
                     theme.BACKGROUND_UNSELECTED,
@@ -148,12 +157,13 @@ def _build_pattern_tab(parent: ctk.CTkFrame, state, context) -> None:
             buttons.append(btn)
 
     # Accent buttons below
+    accents = state.pattern.accents
     for r in range(3):
         for c in range(4):
             idx = r * 4 + c
             fg = (
                 theme.BACKGROUND_SELECTED
-                if state.pattern.accents[idx]
+                if accents[idx]
                 else (theme.BACKGROUND_UNSELECTED, theme.BACKGROUND_UNSELECTED)
             )
             btn = ctk.CTkButton(
@@ -200,11 +210,11 @@ def _build_pattern_tab(parent: ctk.CTkFrame, state, context) -> None:
     # Chord memory recall
     def recall_chord():
         if state.chord_memory:
-            state.pattern.mask = [False] * 12
-            state.pattern.accents = [False] * 12  # Reset accents
+            mask_bits = 0
             for note in state.chord_memory:
-                semitone = note % 12
-                state.pattern.mask[semitone] = True
+                mask_bits |= 1 << (note % 12)
+            state.pattern.mask_bits = mask_bits
+            state.pattern.accent_bits = 0  # Reset accents
             refresh_ui()
 
     # Initial refresh
@@ -8,12 +8,12 @@ Modules:
 - note_producer.py: NoteProducer for velocity and accent logic
 - dispatcher.py: MidiDispatcher for thread-safe MIDI message queuing
 - state_validator.py: Refactored ArpState with nested configuration objects
-- engine_refactored.py: Main ArpEngine orchestrating all components
+- arp_engin.py: Main ArpEngine orchestrating all components
 - legacy_adapter.py: Backward compatibility shim
 
 Import Examples:
     # New (recommended)
-    from src.midi.arp.engine_refactored import ArpEngine
+    from src.midi.arp.arp_engin import ArpEngine
     from src.midi.arp.state_validator import ArpState
 
     # Legacy (still works, via compatibility shim)
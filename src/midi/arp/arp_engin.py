@@ -6,12 +6,14 @@ and MIDI dispatching into a cohesive real-time note generation system.
 
 import asyncio
 import logging
-from typing import Optional
+from array import array
+from collections import deque
+from typing import Dict, Optional, Sequence, Tuple
 
-from typing import List
+import numpy as np
 
 from .dispatcher import MidiDispatcher
-from .modes import create_mode
+from .modes import ArpMode, create_mode
 from .note_producer import NoteProducer
 from .state_validator import ArpState
 from .timing import TimingCalculator
@@ -19,6 +21,23 @@ from .timing import TimingCalculator
 logger = logging.getLogger(__name__)
 
 
+def _build_octave_shifts() -> Dict[Tuple[int, str], np.ndarray]:
+    """Semitone shift per octave row for every octave range and direction."""
+    shifts = {}
+    for octave_range in range(1, 5):
+        # BOTH goes down (range - 1) // 2 octaves and up the rest
+        down_count = (octave_range - 1) // 2
+        up_count = octave_range - 1 - down_count
+        shifts[(octave_range, "UP")] = np.arange(octave_range) * 12
+        shifts[(octave_range, "DOWN")] = -np.arange(octave_range - 1, -1, -1) * 12
+        shifts[(octave_range, "BOTH")] = np.arange(-down_count, up_count + 1) * 12
+    return shifts
+
+
+# Only 4 octave ranges x 3 directions exist, so the shifts are built once
+_OCTAVE_SHIFTS = _build_octave_shifts()
+
+
 class ArpEngine:
     """Refactored arpeggiator engine with separated concerns.
 
@@ -27,6 +46,14 @@ class ArpEngine:
     and MIDI dispatching.
     """
 
+    # Maximum lag (seconds) behind the step schedule before resyncing
+    MAX_LAG = 0.1
+    # Scheduler wake-up period and how far ahead (seconds) steps are queued
+    SCHEDULER_INTERVAL = 0.025
+    LOOKAHEAD = 0.1
+    # Seconds each preview note sounds
+    PREVIEW_STEP = 0.08
+
     def __init__(
         self,
         arp_state: ArpState,
@@ -38,11 +65,12 @@ class ArpEngine:
         Args:
             arp_state: ArpState instance for configuration
             midi_engine: MIDI engine with queue for message delivery
-            event_loop: Optional asyncio event loop (uses current if not provided)
+            event_loop: Optional asyncio event loop (the running loop is
+                captured on start() if not provided)
         """
         self.state = arp_state
         self.midi_engine = midi_engine
-        self._loop = event_loop or asyncio.get_event_loop()
+        self._loop = event_loop
 
         # Initialize specialized components
         self._timing_calc = TimingCalculator()
@@ -54,6 +82,24 @@ class ArpEngine:
         self._running = False
         self._step = 0
         self._position = 0
+        # Step timers queued on the loop by the lookahead scheduler
+        self._pending_steps: deque = deque()
+        # Note_off timers mapped to the note they release (pruned once fired)
+        self._pending_offs: Dict[asyncio.TimerHandle, int] = {}
+
+        # Expanded-note cache, keyed on the pattern/octave fingerprint
+        self._exp_cache_notes: Optional[list] = None
+        self._exp_cache_octave: Optional[int] = None
+        self._exp_cache_dir: Optional[str] = None
+        self._exp_cache_gen = 0  # bumped on every rebuild
+        self._exp_cache: array = array("B")
+
+        # Mode strategy and active-index cache, invalidated with the above
+        self._mode_name: Optional[str] = None
+        self._mode: Optional[ArpMode] = None
+        self._choose_next = None  # choose_next callable of the current mode
+        self._active_cache_key: Optional[tuple] = None
+        self._active_cache: Sequence[int] = ()
 
     def start(self) -> None:
         """Start the arpeggiator engine.
@@ -63,9 +109,15 @@ class ArpEngine:
         """
         if self._running:
             return
+        if self._loop is None:
+            # start() runs on the engine loop, so capture it here
+            self._loop = asyncio.get_running_loop()
         self._running = True
         self._step = 0
         self._position = 0
+        # Pick up the MIDI engine's current queue and loop once per start
+        self._dispatcher.refresh_engine()
+        self._get_mode()  # snapshot the mode strategy for this run
         logger.info(
             f"ArpEngine starting: state.enabled={self.state.enabled}, held_notes={sorted(self.state.held_notes) if self.state else []}"
         )
@@ -74,219 +126,322 @@ class ArpEngine:
     def stop(self) -> None:
         """Stop the arpeggiator engine.
 
-        Cancels the running task if it exists.
-        Safe to call even if not running.
+        Cancels the running task and any steps already queued ahead, and
+        releases sounding notes immediately instead of waiting for their
+        gate timers. Safe to call even if not running.
         """
         self._running = False
         if self._task and not self._task.done():
             self._task.cancel()
+        for handle in self._pending_steps:
+            handle.cancel()
+        self._pending_steps.clear()
+        sounding = []
+        if self._pending_offs:
+            now = self._loop.time()
+            for handle, note in self._pending_offs.items():
+                if handle.when() > now:
+                    handle.cancel()
+                    sounding.append(note)
+            self._pending_offs.clear()
+        # Release every sounding note in one enqueue
+        if sounding:
+            self._dispatcher.send_note_offs(sounding)
         logger.info("ArpEngine stopped")
 
     async def _timing_loop(self) -> None:
-        """Main timing loop that drives step generation.
+        """Lookahead scheduler that drives step generation.
+
+        Every SCHEDULER_INTERVAL seconds the loop wakes and queues, with
+        loop.call_at, every step whose absolute deadline falls within the
+        next LOOKAHEAD seconds. Each queued step fires as a plain callback
+        (_fire_step), so no coroutine runs per step and jitter in this loop
+        (GC pauses, slow UI callbacks) shorter than the lookahead does not
+        delay notes.
 
-        Continuously:
-        1. Calculates timing metadata for current step
-        2. Processes the step (generates notes)
-        3. Sleeps for calculated duration
-        4. Advances to next step
+        Deadlines are kept as integer nanoseconds from an anchor on
+        loop.time(), so step durations add exactly and float rounding happens
+        once per step (when converting for call_at) instead of accumulating
+        over long runs.
 
         Runs until stop() is called or state.enabled becomes False.
         """
         logger.info(f"ArpEngine timing loop started")
-        try:
-            while self._running and self.state and self.state.enabled:
-                try:
-                    # Calculate timing for this step
-                    timing = self._timing_calc.calculate_timing(
-                        bpm=self.state.timing.bpm,
-                        division=self.state.timing.division,
-                        swing_pct=self.state.timing.swing,
-                        step_number=self._step,
-                        tempo_mul=self.state.timing.tempo_mul,
-                    )
-
-                    # Process this step (generate and dispatch notes)
-                    await self._process_step()
-
-                    # Sleep for calculated interval and swing
-                    await asyncio.sleep(timing.total_sleep)
-
-                    self._step += 1
-                except asyncio.CancelledError:
-                    raise  # Re-raise cancellation to outer handler
-                except Exception:
-                    logger.exception("ArpEngine step error, continuing")
-                    await asyncio.sleep(0.05)  # Brief pause on error
-
-        except asyncio.CancelledError:
-            # Normal shutdown via stop()
+        # Loop-invariant lookups bound once as locals
+        loop = self._loop
+        calculate_timing = self._timing_calc.calculate_timing
+        fire_step = self._fire_step
+        pending = self._pending_steps
+        pending_offs = self._pending_offs
+        max_lag_ns = int(self.MAX_LAG * 1e9)
+        lookahead_ns = int(self.LOOKAHEAD * 1e9)
+        interval = self.SCHEDULER_INTERVAL
+        # Schedule anchor (loop clock, seconds) and offset of next step (ns)
+        anchor = loop.time()
+        next_ns = 0
+        # Single try around the whole loop: no per-step exception setup;
+        # on error, log, pause briefly, resync and re-enter the loop
+        while True:
+            try:
+                while self._running and self.state and self.state.enabled:
+                    now = loop.time()
+                    now_ns = round((now - anchor) * 1e9)
+
+                    # Forget timers that have already fired
+                    while pending and pending[0].when() <= now:
+                        pending.popleft()
+                    if pending_offs:
+                        for handle in [h for h in pending_offs if h.when() <= now]:
+                            del pending_offs[handle]
+
+                    if next_ns < now_ns - max_lag_ns:
+                        # Too far behind; resync instead of bursting to catch up
+                        logger.debug(
+                            f"ArpEngine lagging {(now_ns - next_ns) / 1e9:.3f}s, resyncing"
+                        )
+                        anchor = now
+                        next_ns = now_ns = 0
+
+                    # Queue every step due within the lookahead window
+                    horizon_ns = now_ns + lookahead_ns
+                    while next_ns < horizon_ns:
+                        pending.append(loop.call_at(anchor + next_ns / 1e9, fire_step))
+                        tc = self.state.timing
+                        # Next deadline = previous deadline + step length,
+                        # never "now + step length", so nothing drifts
+                        timing = calculate_timing(
+                            tc.bpm, tc.division, tc.swing, self._step, tc.tempo_mul
+                        )
+                        next_ns += round(timing.total_sleep * 1e9)
+                        self._step += 1
+
+                    await asyncio.sleep(interval)
+                return
+            except asyncio.CancelledError:
+                # Normal shutdown via stop()
+                return
+            except Exception:
+                logger.exception("ArpEngine scheduler error, continuing")
+            try:
+                await asyncio.sleep(0.05)  # Brief pause on error
+            except asyncio.CancelledError:
+                return
+            anchor = loop.time()
+            next_ns = 0
+
+    def _fire_step(self) -> None:
+        """Timer callback for one queued step.
+
+        Skips the step if the engine was stopped or disabled after it was
+        queued; errors are logged so one bad step cannot break the loop.
+        """
+        if not (self._running and self.state and self.state.enabled):
             return
+        try:
+            self._process_step()
         except Exception:
-            logger.exception("ArpEngine timing loop error")
+            logger.exception("ArpEngine step error, continuing")
 
-    def _build_expanded_notes(self) -> List[int]:
+    def _build_expanded_notes(self) -> array:
         """Build the full note sequence by expanding held notes across octave range.
 
         Uses state.octave (1-4) to determine how many octaves to span,
         and state.octave_dir (UP/DOWN/BOTH) to determine direction.
 
+        The result is cached until pattern.notes, octave or octave_dir change,
+        so callers must treat it as read-only.
+
         Returns:
-            Sorted list of MIDI notes covering the octave range.
+            Byte array (array("B")) of MIDI notes covering the octave range.
         """
-        base_notes = list(self.state.pattern.notes)  # already sorted
-        if not base_notes:
-            return []
+        st = self.state
+        notes = st.pattern.notes
+        # Hit path compares in place (list == list), allocating nothing
+        if (
+            notes == self._exp_cache_notes
+            and st.octave == self._exp_cache_octave
+            and st.octave_dir == self._exp_cache_dir
+        ):
+            return self._exp_cache
+
+        self._exp_cache_notes = list(notes)
+        self._exp_cache_octave = st.octave
+        self._exp_cache_dir = st.octave_dir
+        self._exp_cache = self._expand_notes(
+            notes, st.octave, (st.octave_dir or "UP").upper()
+        )
+        self._exp_cache_gen += 1
+        return self._exp_cache
 
-        octave_range = max(1, min(4, self.state.octave))
+    @staticmethod
+    def _expand_notes(notes: Sequence[int], octave: int, direction: str) -> array:
+        """Expand base notes across the octave range (uncached).
+
+        Args:
+            notes: Sorted base MIDI notes
+            octave: Number of octaves to span (clamped to 1..4)
+            direction: UP, DOWN or BOTH
+
+        Returns:
+            Byte array (array("B")) of MIDI notes covering the octave range.
+        """
+        if not notes:
+            return array("B")
+
+        octave_range = max(1, min(4, int(octave)))
         if octave_range == 1:
-            return base_notes
-
-        expanded = []
-        direction = (self.state.octave_dir or "UP").upper()
-
-        if direction == "UP":
-            for oct in range(octave_range):
-                for note in base_notes:
-                    n = note + oct * 12
-                    if 0 <= n <= 127:
-                        expanded.append(n)
-        elif direction == "DOWN":
-            for oct in range(octave_range - 1, -1, -1):
-                for note in base_notes:
-                    n = note - oct * 12
-                    if 0 <= n <= 127:
-                        expanded.append(n)
-            expanded.sort()
-        else:  # BOTH
-            # Go down (octave_range // 2) and up (octave_range - octave_range // 2 - 1)
-            down_count = (octave_range - 1) // 2
-            up_count = octave_range - 1 - down_count
-            for oct in range(-down_count, up_count + 1):
-                for note in base_notes:
-                    n = note + oct * 12
-                    if 0 <= n <= 127:
-                        expanded.append(n)
-            expanded.sort()
-
-        return expanded
-
-    async def _process_step(self) -> None:
+            return array("B", notes)  # already sorted, no expansion needed
+
+        shifts = _OCTAVE_SHIFTS.get((octave_range, direction))
+        if shifts is None:  # unknown direction behaves like BOTH
+            shifts = _OCTAVE_SHIFTS[(octave_range, "BOTH")]
+
+        # One row per octave, flattened in octave order and kept in MIDI range
+        grid = np.asarray(notes)[None, :] + shifts[:, None]
+        expanded = grid[(grid >= 0) & (grid <= 127)]
+        if direction != "UP":
+            expanded = np.sort(expanded)
+
+        # Compact byte buffer; indexing still yields Python ints
+        return array("B", expanded.astype(np.uint8).tobytes())
+
+    def _get_mode(self) -> ArpMode:
+        """Return the mode strategy for state.mode, reusing the last instance.
+
+        Also snapshots the mode's choose_next callable so the per-step path
+        calls it directly; it is only re-bound when state.mode changes.
+        """
+        name = (self.state.mode or "UP").upper()
+        if name != self._mode_name:
+            self._mode = create_mode(name)
+            self._choose_next = self._mode.choose_next
+            self._mode_name = name
+        return self._mode
+
+    def set_mode(self, mode_name: str) -> None:
+        """Change the playback mode and re-snapshot the mode strategy.
+
+        Args:
+            mode_name: Name of mode (UP, DOWN, UPDOWN, RANDOM, CHORD)
+        """
+        self.state.mode = mode_name
+        self._get_mode()
+
+    def _get_cached_pattern(self) -> Tuple[array, Sequence[int]]:
+        """Return expanded notes and active indices for the current state.
+
+        Active indices are only rebuilt when the expanded notes or the mode
+        change, so the per-step path does no list allocation.
+
+        Returns:
+            Tuple of (expanded_notes, active_indices).
+        """
+        expanded_notes = self._build_expanded_notes()
+        mode = self._get_mode()
+        key = (self._exp_cache_gen, self._mode_name)
+        if key != self._active_cache_key:
+            self._active_cache = mode.build_active_indices(expanded_notes)
+            self._active_cache_key = key
+        return expanded_notes, self._active_cache
+
+    def _process_step(self) -> None:
         """Process a single step: generate and dispatch note.
 
         If no active notes for this step, silently advances.
         Otherwise produces a note, calculates velocity, dispatches note_on
         and schedules note_off based on gate percentage.
         """
-        # Build expanded notes across octave range
-        expanded_notes = self._build_expanded_notes()
-        pattern_notes = list(self.state.pattern.notes) if self.state.pattern else []
+        # Expanded notes and active note indices (cached between steps)
+        expanded_notes, active_indices = self._get_cached_pattern()
+        st = self.state
 
         if not expanded_notes:
             if self._step % 8 == 0:  # Log every 8 steps to avoid spam
                 logger.debug(
-                    f"ArpEngine step {self._step}: no expanded_notes (pattern.notes={pattern_notes})"
+                    f"ArpEngine step {self._step}: no expanded_notes (pattern.notes={st.pattern.notes})"
                 )
             return
 
-        # Get the mode strategy for current mode
-        mode = create_mode(self.state.mode)
-
-        # Build list of active note indices
-        active_indices = mode.build_active_indices(expanded_notes)
-
         if not active_indices:
             return
 
         # Choose which note to play and advance position
-        idx, new_pos = mode.choose_next(active_indices, self._position)
+        idx, new_pos = self._choose_next(active_indices, self._position)
         self._position = new_pos
 
         # Get the actual step index in expanded notes
         step_idx = active_indices[idx]
 
-        # Produce note and velocity
+        # Produce note and velocity (accent applied by semitone)
         note = expanded_notes[step_idx]
-        velocity = self._note_producer.calculate_velocity(
-            step_idx, len(expanded_notes), self.state
+        velocity = self._note_producer.produce_velocity(
+            note, step_idx, len(expanded_notes), st
         )
 
-        # Apply accent if enabled for this note's semitone
-        if self._note_producer.should_accent(note, self.state):
-            velocity = self._note_producer._apply_accent(velocity)
-
-        # Send note_on message
-        if self._dispatcher.send_note_on(note, velocity):
-            # Schedule note_off after gate duration
-            gate_duration = self._timing_calc.calculate_gate_duration(
-                bpm=self.state.timing.bpm,
-                gate_pct=self.state.gate_pct,
-            )
-            # If latch is HOLD, sustain notes longer
-            if self.state.latch == "HOLD":
-                gate_duration = max(gate_duration, 5.0)  # At least 5 seconds
-            asyncio.create_task(self._schedule_note_off(note, gate_duration))
-
-    async def _schedule_note_off(self, note: int, delay: float) -> None:
-        """Schedule a note_off message after delay.
+        # Gate duration for the note_off (memoized on bpm and gate_pct)
+        gate_duration = self._timing_calc.calculate_gate_duration(
+            st.timing.bpm, st.gate_pct
+        )
+        # If latch is HOLD, sustain notes longer
+        if st.latch == "HOLD":
+            gate_duration = max(gate_duration, 5.0)  # At least 5 seconds
 
-        Args:
-            note: MIDI note to release
-            delay: Delay in seconds before sending note_off
-        """
-        await asyncio.sleep(delay)
-        self._dispatcher.send_note_off(note)
+        # Send note_on now and schedule note_off in one dispatcher call
+        handle = self._dispatcher.send_note_pair(
+            note, velocity, gate_duration, self._loop
+        )
+        if handle is not None:
+            self._pending_offs[handle] = note
 
     def preview(self, steps: int = 8) -> None:
         """Preview the next N steps of the pattern.
 
-        Asynchronously plays a quick preview of the pattern for UI feedback.
-        Runs in the background without affecting the main engine.
+        Plays a quick preview of the pattern for UI feedback as a chain of
+        loop timer callbacks, without affecting the main engine.
 
         Args:
             steps: Number of steps to preview (default 8)
         """
 
-        async def _do_preview():
-            """Internal async preview generator."""
-            if not self._dispatcher.has_queue():
+        def _preview_step(remaining: int, position: int, prev_note) -> None:
+            """Release the previous note, then play one step and re-arm."""
+            disp = self._dispatcher
+            if prev_note is not None:
+                disp.send_note_off(prev_note)
+            if remaining <= 0 or not disp.has_queue():
                 return
 
-            # Build expanded notes
-            expanded_notes = self._build_expanded_notes()
-            if not expanded_notes:
+            # Expanded notes and active indices (shared with the main loop)
+            expanded_notes, active_indices = self._get_cached_pattern()
+            if not expanded_notes or not active_indices:
                 return
 
-            # Get mode strategy
-            mode = create_mode(self.state.mode)
-            active_indices = mode.build_active_indices(expanded_notes)
-
-            if not active_indices:
-                return
+            # Choose next note
+            idx, position = self._mode.choose_next(active_indices, position)
+            step_idx = active_indices[idx]
 
-            # Preview specified number of steps
-            position = 0
-            for _ in range(steps):
-                # Choose next note
-                idx, position = mode.choose_next(active_indices, position)
-                step_idx = active_indices[idx]
+            note = expanded_notes[step_idx]
+            velocity = self._note_producer.produce_velocity(
+                note, step_idx, len(expanded_notes), self.state
+            )
 
-                note = expanded_notes[step_idx]
-                velocity = self._note_producer.calculate_velocity(
-                    step_idx, len(expanded_notes), self.state
+            # Hold the note for one preview step; its note_off runs first in
+            # the next callback, so repeated notes are never cut short
+            if disp.send_note_on(note, velocity):
+                loop.call_later(
+                    self.PREVIEW_STEP, _preview_step, remaining - 1, position, note
                 )
+            else:
+                loop.call_soon(_preview_step, remaining - 1, position, None)
 
-                # Apply accent if enabled
-                if self._note_producer.should_accent(note, self.state):
-                    velocity = self._note_producer._apply_accent(velocity)
-
-                # Send note_on and note_off with short delay
-                if self._dispatcher.send_note_on(note, velocity):
-                    await asyncio.sleep(0.08)
-                    self._dispatcher.send_note_off(note)
+        # Before the first start() fall back to the MIDI engine's loop
+        loop = self._loop or getattr(self.midi_engine, "_loop", None)
+        if loop is None:
+            logger.debug("AR preview skipped: no event loop yet")
+            return
 
-        # Run preview in background
-        asyncio.run_coroutine_threadsafe(_do_preview(), self._loop)
+        # Start the chain on the engine loop (preview is called from the GUI)
+        loop.call_soon_threadsafe(_preview_step, steps, 0, None)
 
     # Backward compatibility methods (deprecated)
     def _build_active_order(self) -> None:
@@ -294,9 +449,7 @@ class ArpEngine:
 
         Kept for backward compatibility. Do not use in new code.
         """
-        expanded = self._build_expanded_notes()
-        mode = create_mode(self.state.mode)
-        active = mode.build_active_indices(expanded)
+        _, active = self._get_cached_pattern()
         # Store in a temporary attribute for any legacy code that checks it
         self._active_order = active
 
@@ -305,13 +458,13 @@ class ArpEngine:
 
         Kept for backward compatibility. Do not use in new code.
         """
-        mode = create_mode(self.state.mode)
-        if not hasattr(self, "_active_order"):
-            self._build_active_order()
+        # Cheap on every call: the order is cached on (notes generation, mode),
+        # so it no longer goes stale after the first build
+        self._build_active_order()
 
         if not self._active_order:
             return 0
 
-        idx, new_pos = mode.choose_next(self._active_order, self._position)
+        idx, new_pos = self._choose_next(self._active_order, self._position)
         self._position = new_pos
         return idx
@@ -4,7 +4,9 @@ Handles enqueueing note_on and note_off messages to the MIDI engine queue
 in a thread-safe manner.
 """
 
+import asyncio
 import logging
+from functools import lru_cache
 from typing import Optional
 
 import mido
@@ -14,6 +16,33 @@ from src.midi.message_wrapper import MidiMessageWrapper
 logger = logging.getLogger(__name__)
 
 
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Return the event loop running in the calling thread, or None."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _arp_message(
+    msg_type: str, note: int, velocity: int, channel: int
+) -> MidiMessageWrapper:
+    """Build (once) the wrapped arp message for a note event.
+
+    Consumers only read the wrapper and copy the message before changing
+    it, so one instance can be enqueued any number of times.
+    """
+    message = mido.Message(msg_type, note=note, velocity=velocity, channel=channel)
+    return MidiMessageWrapper(message, is_arp=True)
+
+
+def _put_all(queue, messages: list) -> None:
+    """Put each message on queue in order (runs on the queue's loop)."""
+    for message in messages:
+        queue.put_nowait(message)
+
+
 class MidiDispatcher:
     """Dispatches MIDI messages to engine queue with thread-safety."""
 
@@ -24,6 +53,23 @@ class MidiDispatcher:
             midi_engine: MIDI engine with queue and optional event loop.
         """
         self.midi_engine = midi_engine
+        self._queue = None
+        self._engine_loop = None
+        self._verbose = False
+        self.refresh_engine()
+
+    def refresh_engine(self) -> None:
+        """Snapshot the engine's queue, event loop and verbose flag.
+
+        Enqueueing reads the snapshot instead of looking the attributes up
+        per message. It is refreshed automatically while the queue is still
+        missing (the engine creates it when it starts running); call this
+        again if the engine replaces its queue or loop.
+        """
+        engine = self.midi_engine
+        self._queue = getattr(engine, "queue", None)
+        self._engine_loop = getattr(engine, "_loop", None)
+        self._verbose = getattr(engine, "verbose", False)
 
     def send_note_on(self, note: int, velocity: int, channel: int = 0) -> bool:
         """Send a note_on message.
@@ -37,13 +83,9 @@ class MidiDispatcher:
             True if successfully enqueued, False on error.
         """
         try:
-            message = mido.Message(
-                "note_on", note=note, velocity=velocity, channel=channel
-            )
-            wrapped_message = MidiMessageWrapper(message, is_arp=True)
+            wrapped_message = _arp_message("note_on", note, velocity, channel)
             result = self._enqueue_message(wrapped_message)
-            verbose = getattr(self.midi_engine, "verbose", False)
-            if verbose:
+            if self._verbose:
                 logger.info(
                     f"AR dispatcher sending note_on: note={note} velocity={velocity} enqueued={result}"
                 )
@@ -64,15 +106,83 @@ class MidiDispatcher:
             True if successfully enqueued, False on error.
         """
         try:
-            message = mido.Message(
-                "note_off", note=note, velocity=velocity, channel=channel
-            )
-            wrapped_message = MidiMessageWrapper(message, is_arp=True)
+            wrapped_message = _arp_message("note_off", note, velocity, channel)
             return self._enqueue_message(wrapped_message)
         except Exception as e:
             logger.debug(f"Error creating note_off message: {e}")
             return False
 
+    def send_note_ons(self, notes, velocity: int, channel: int = 0) -> bool:
+        """Send note_on messages for several notes in one enqueue.
+
+        Args:
+            notes: Iterable of MIDI notes (0..127) to start
+            velocity: MIDI velocity (0..127) shared by all notes
+            channel: MIDI channel (0..15), default 0
+
+        Returns:
+            True if successfully enqueued, False on error.
+        """
+        try:
+            messages = [_arp_message("note_on", n, velocity, channel) for n in notes]
+        except Exception as e:
+            logger.error(f"Error creating note_on messages: {e}")
+            return False
+        if not messages:
+            return True
+        return self._enqueue_messages(messages)
+
+    def send_note_offs(self, notes, channel: int = 0) -> bool:
+        """Send note_off messages for several notes in one enqueue.
+
+        Args:
+            notes: Iterable of MIDI notes (0..127) to release
+            channel: MIDI channel (0..15), default 0
+
+        Returns:
+            True if successfully enqueued, False on error.
+        """
+        try:
+            messages = [_arp_message("note_off", n, 0, channel) for n in notes]
+        except Exception as e:
+            logger.debug(f"Error creating note_off messages: {e}")
+            return False
+        if not messages:
+            return True
+        return self._enqueue_messages(messages)
+
+    def send_note_pair(
+        self,
+        note: int,
+        velocity: int,
+        gate_duration: float,
+        loop: asyncio.AbstractEventLoop,
+        channel: int = 0,
+    ) -> Optional[asyncio.TimerHandle]:
+        """Send a note_on now and schedule its note_off in a single call.
+
+        The note_off is a timer callback on loop, so no coroutine or task
+        is created per note.
+
+        Args:
+            note: MIDI note (0..127)
+            velocity: MIDI velocity (0..127)
+            gate_duration: Seconds until the note_off is sent
+            loop: Event loop that runs the note_off timer
+            channel: MIDI channel (0..15), default 0
+
+        Returns:
+            TimerHandle of the pending note_off, or None if note_on failed.
+        """
+        if not self.send_note_on(note, velocity, channel):
+            return None
+        return loop.call_later(gate_duration, self.send_note_off, note, 0, channel)
+
+    def _refreshed_queue(self):
+        """Re-snapshot the engine and return its queue (None if still missing)."""
+        self.refresh_engine()
+        return self._queue
+
     def _enqueue_message(self, message: mido.Message) -> bool:
         """Enqueue message to MIDI engine in thread-safe manner.
 
@@ -84,14 +194,17 @@ class MidiDispatcher:
         """
         try:
             # Check if queue exists first
-            queue = getattr(self.midi_engine, "queue", None)
+            queue = self._queue or self._refreshed_queue()
             if not queue:
                 logger.error(f"MIDI engine queue not initialized yet")
                 return False
 
             # Try to use event loop for thread-safe enqueueing
-            event_loop = getattr(self.midi_engine, "_loop", None)
-            if event_loop:
+            event_loop = self._engine_loop
+            if event_loop is not None and event_loop is _running_loop():
+                # Already on the engine loop: skip the self-pipe wakeup
+                queue.put_nowait(message)
+            elif event_loop:
                 try:
                     event_loop.call_soon_threadsafe(queue.put_nowait, message)
                     logger.debug(
@@ -112,6 +225,39 @@ class MidiDispatcher:
             logger.error(f"Failed to enqueue MIDI message: {e}")
             return False
 
+    def _enqueue_messages(self, messages: list) -> bool:
+        """Enqueue several messages with a single cross-thread hop.
+
+        Args:
+            messages: mido Messages to enqueue, in order.
+
+        Returns:
+            True if successfully enqueued, False on error.
+        """
+        try:
+            queue = self._queue or self._refreshed_queue()
+            if not queue:
+                logger.error("MIDI engine queue not initialized yet")
+                return False
+
+            event_loop = self._engine_loop
+            if event_loop is not None and event_loop is _running_loop():
+                _put_all(queue, messages)
+            elif event_loop:
+                try:
+                    event_loop.call_soon_threadsafe(_put_all, queue, messages)
+                except RuntimeError as e:
+                    logger.warning(
+                        f"Event loop call_soon_threadsafe failed, falling back to direct enqueue: {e}"
+                    )
+                    _put_all(queue, messages)
+            else:
+                _put_all(queue, messages)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to enqueue MIDI messages: {e}")
+            return False
+
     def has_queue(self) -> bool:
         """Check if MIDI engine has a valid queue.
 
@@ -13,7 +13,7 @@ Usage (both work identically):
     from src.midi.arp_state import ArpState
 
     # New import (preferred going forward)
-    from src.midi.arp.engine_refactored import ArpEngine
+    from src.midi.arp.arp_engin import ArpEngine
     from src.midi.arp.state_validator import ArpState
 """
 
@@ -5,33 +5,65 @@ through the active note set.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Sequence, Tuple
 import random
 
 
+@lru_cache(maxsize=None)
+def _updown_path(n: int) -> Tuple[int, ...]:
+    """Build the UPDOWN bounce path for n notes (cached per n)."""
+    if n <= 1:
+        return tuple(range(n))
+    # Up path: all notes; down path: all notes except first and last
+    # (to avoid repeating endpoints)
+    return tuple(range(n)) + tuple(range(n - 2, 0, -1))
+
+
+def _choose_linear(
+    active_indices: Sequence[int], current_position: int
+) -> Tuple[int, int]:
+    """Return current index and advance position linearly.
+
+    Shared by the stateless modes as a static choose_next, so fetching it
+    from an instance yields this plain function rather than a bound method.
+    """
+    n = len(active_indices)
+    if not n:
+        return 0, 0
+
+    # Modulo only after the active set shrinks; otherwise compare-and-reset
+    pos = current_position if current_position < n else current_position % n
+    new_pos = pos + 1
+    return pos, (0 if new_pos >= n else new_pos)
+
+
 class ArpMode(ABC):
     """Abstract base class for arpeggiator playback modes."""
 
+    __slots__ = ()
+
     @abstractmethod
-    def build_active_indices(self, notes: List[int]) -> List[int]:
+    def build_active_indices(self, notes: Sequence[int]) -> Sequence[int]:
         """Build list of active note indices from pattern notes.
 
         Args:
-            notes: List of MIDI notes in the pattern.
+            notes: Sequence of MIDI notes in the pattern.
 
         Returns:
-            List of indices (0..len(notes)-1) that are currently active, in playing order.
+            Indices (0..len(notes)-1) that are currently active, in playing order.
+            Any indexable sequence (list or range) is accepted by choose_next.
         """
         pass
 
     @abstractmethod
     def choose_next(
-        self, active_indices: List[int], current_position: int
+        self, active_indices: Sequence[int], current_position: int
     ) -> Tuple[int, int]:
         """Choose the next note and advance position.
 
         Args:
-            active_indices: List of active indices from build_active_indices.
+            active_indices: Active indices from build_active_indices.
             current_position: Current position in the active_indices list.
 
         Returns:
@@ -47,85 +79,67 @@ class ArpMode(ABC):
 class UpMode(ArpMode):
     """Play notes in ascending order."""
 
-    def build_active_indices(self, notes: List[int]) -> List[int]:
-        """Return indices in ascending order of notes."""
-        return list(range(len(notes)))
+    __slots__ = ()
 
-    def choose_next(
-        self, active_indices: List[int], current_position: int
-    ) -> Tuple[int, int]:
-        """Return current index and advance position linearly."""
-        if not active_indices:
-            return 0, 0
+    def build_active_indices(self, notes: Sequence[int]) -> Sequence[int]:
+        """Return indices in ascending order of notes (as a range, no allocation)."""
+        return range(len(notes))
 
-        pos = current_position % len(active_indices)
-        new_pos = (current_position + 1) % len(active_indices)
-        return pos, new_pos
+    choose_next = staticmethod(_choose_linear)
 
 
 class DownMode(ArpMode):
     """Play notes in descending order."""
 
-    def build_active_indices(self, notes: List[int]) -> List[int]:
-        """Return indices in descending order of notes."""
-        return list(reversed(range(len(notes))))
+    __slots__ = ()
 
-    def choose_next(
-        self, active_indices: List[int], current_position: int
-    ) -> Tuple[int, int]:
-        """Return current index and advance position linearly."""
-        if not active_indices:
-            return 0, 0
+    def build_active_indices(self, notes: Sequence[int]) -> Sequence[int]:
+        """Return indices in descending order of notes (as a range, no allocation)."""
+        return range(len(notes) - 1, -1, -1)
 
-        pos = current_position % len(active_indices)
-        new_pos = (current_position + 1) % len(active_indices)
-        return pos, new_pos
+    choose_next = staticmethod(_choose_linear)
 
 
 class UpDownMode(ArpMode):
     """Play notes ascending then descending, bouncing at endpoints."""
 
-    def build_active_indices(self, notes: List[int]) -> List[int]:
-        """Return path: up + down (excluding endpoints to avoid repetition)."""
-        if not notes:
-            return []
-        if len(notes) == 1:
-            return [0]
-
-        # Up path: all notes
-        up = list(range(len(notes)))
-        # Down path: all notes except first and last (to avoid repeating endpoints)
-        down = list(reversed(range(1, len(notes) - 1))) if len(notes) > 2 else []
+    __slots__ = ()
 
-        return up + down
+    def build_active_indices(self, notes: Sequence[int]) -> Sequence[int]:
+        """Return path: up + down (excluding endpoints to avoid repetition).
 
-    def choose_next(
-        self, active_indices: List[int], current_position: int
-    ) -> Tuple[int, int]:
-        """Return current index and advance position linearly."""
-        if not active_indices:
-            return 0, 0
+        The path depends only on len(notes), so it comes from a shared
+        per-length cache as an immutable tuple.
+        """
+        return _updown_path(len(notes))
 
-        pos = current_position % len(active_indices)
-        new_pos = (current_position + 1) % len(active_indices)
-        return pos, new_pos
+    choose_next = staticmethod(_choose_linear)
 
 
 class RandomMode(ArpMode):
     """Play notes in random order."""
 
-    def build_active_indices(self, notes: List[int]) -> List[int]:
+    __slots__ = ("_rng", "_randbelow")
+
+    def __init__(self) -> None:
+        """Bind a private RNG's bounded-int primitive for the per-step path."""
+        self._rng = random.Random()
+        # Random._randbelow skips randrange's argument handling
+        self._randbelow = self._rng._randbelow
+
+    def build_active_indices(self, notes: Sequence[int]) -> Sequence[int]:
         """Return all indices (randomness applied per-note)."""
-        return list(range(len(notes)))
+        return range(len(notes))
 
     def choose_next(
-        self, active_indices: List[int], current_position: int
+        self, active_indices: Sequence[int], current_position: int
     ) -> Tuple[int, int]:
         """Return random index (position stays at 0)."""
-        if not active_indices:
+        n = len(active_indices)
+        if not n:
             return 0, 0
 
-        idx = random.randrange(len(active_indices))
+        idx = self._randbelow(n)
         # Position doesn't advance in random mode; new_pos = 0 indicates we start fresh
         return idx, 0
 
@@ -141,41 +155,41 @@ class ChordMode(ArpMode):
     When implemented, will play all notes at once rather than sequentially.
     """
 
-    def build_active_indices(self, notes: List[int]) -> List[int]:
+    __slots__ = ()
+
+    def build_active_indices(self, notes: Sequence[int]) -> Sequence[int]:
         """Return all indices."""
-        return list(range(len(notes)))
+        return range(len(notes))
 
-    def choose_next(
-        self, active_indices: List[int], current_position: int
-    ) -> Tuple[int, int]:
-        """Return current index and advance position (placeholder).
+    # TODO: Future implementation will return all indices at once,
+    # represented as a special position value.
+    choose_next = staticmethod(_choose_linear)
 
-        TODO: Future implementation will return all indices at once,
-        represented as a special position value.
-        """
-        if not active_indices:
-            return 0, 0
 
-        pos = current_position % len(active_indices)
-        new_pos = (current_position + 1) % len(active_indices)
-        return pos, new_pos
+# Stateless modes are shared singletons; RandomMode owns an RNG, so each
+# caller gets its own instance
+_MODE_MAP = {
+    "UP": UpMode(),
+    "DOWN": DownMode(),
+    "UPDOWN": UpDownMode(),
+    "CHORD": ChordMode(),
+}
 
 
 def create_mode(mode_name: str) -> ArpMode:
-    """Factory function to create mode instance by name.
+    """Factory function to get a mode instance by name.
 
     Args:
         mode_name: Name of mode (UP, DOWN, UPDOWN, RANDOM, CHORD)
 
     Returns:
         ArpMode instance, defaults to UpMode if name not recognized.
+        Stateless modes are shared; RANDOM returns a fresh RandomMode.
     """
-    mode_map = {
-        "UP": UpMode,
-        "DOWN": DownMode,
-        "UPDOWN": UpDownMode,
-        "RANDOM": RandomMode,
-        "CHORD": ChordMode,
-    }
-    mode_class = mode_map.get((mode_name or "UP").upper(), UpMode)
-    return mode_class()
+    mode = _MODE_MAP.get(mode_name)
+    if mode is not None:
+        return mode
+    name = (mode_name or "UP").upper()
+    if name == "RANDOM":
+        return RandomMode()
+    return _MODE_MAP.get(name, _MODE_MAP["UP"])
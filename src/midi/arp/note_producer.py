@@ -5,14 +5,40 @@ velocity mode, and accent configuration.
 """
 
 import random
+from functools import lru_cache
 from typing import Tuple
 
-from .state_validator import ArpState
+from .state_validator import VELOCITY_MODES, ArpState
+
+
+@lru_cache(maxsize=64)
+def _ramp_table(total_steps: int, low: int, high: int) -> Tuple[int, ...]:
+    """Rising velocity ramp over a sequence of total_steps notes.
+
+    RAMP_DOWN reads the same table from the end.
+
+    Args:
+        total_steps: Number of notes in the expanded sequence
+        low: Velocity of the first step
+        high: Velocity of the last step
+
+    Returns:
+        Tuple of total_steps velocities clamped to 0..127.
+    """
+    if total_steps <= 1:
+        return (max(0, min(127, low)),)
+    last = total_steps - 1
+    return tuple(
+        max(0, min(127, int(low + (k / last) * (high - low))))
+        for k in range(total_steps)
+    )
 
 
 class NoteProducer:
     """Produces note information (pitch and velocity) for a pattern step."""
 
+    __slots__ = ("_randbelow", "_vel_handlers")
+
     BASE_NOTE = 60  # Middle C (C4)
     MIN_NOTE = 0
     MAX_NOTE = 127
@@ -22,9 +48,26 @@ class NoteProducer:
     RAMP_MIN_VEL = 40
     RAMP_MAX_VEL = 127
 
+    # Number of velocities RANDOM mode draws from (RAMP_MIN_VEL..RAMP_MAX_VEL)
+    _RANDOM_SPAN = RAMP_MAX_VEL - RAMP_MIN_VEL + 1
+
+    # Accented velocity (x1.25, clamped) for every input velocity 0..127
+    _ACCENT_LUT = bytes(min(127, int(v * 1.25)) for v in range(128))
+
     def __init__(self) -> None:
         """Initialize note producer."""
-        pass
+        # Private RNG per producer (engines may run in their own threads);
+        # Random._randbelow skips randint's randrange argument handling
+        self._randbelow = random.Random()._randbelow
+        # Indexed by VelocityConfig.mode_id (same order as VELOCITY_MODES)
+        self._vel_handlers = (
+            self._vel_original,
+            self._vel_fixed,
+            self._vel_ramp_up,
+            self._vel_ramp_down,
+            self._vel_random,
+            self._vel_accent_first,
+        )
 
     def calculate_velocity(
         self, step_idx: int, total_steps: int, state: ArpState
@@ -39,40 +82,52 @@ class NoteProducer:
         Returns:
             Velocity (0..127).
         """
-        vel_mode = (state.velocity.mode or "ORIGINAL").upper()
-
-        if vel_mode == "FIXED":
-            return self._clamp_velocity(state.velocity.fixed_velocity)
-
-        elif vel_mode == "RANDOM":
-            return random.randint(self.RAMP_MIN_VEL, self.RAMP_MAX_VEL)
-
-        elif vel_mode == "RAMP_UP":
-            ratio = step_idx / (total_steps - 1) if total_steps > 1 else 0
-            vel = int(
-                self.RAMP_MIN_VEL + ratio * (self.RAMP_MAX_VEL - self.RAMP_MIN_VEL)
-            )
-            return self._clamp_velocity(vel)
-
-        elif vel_mode == "RAMP_DOWN":
-            ratio = (
-                (total_steps - 1 - step_idx) / (total_steps - 1)
-                if total_steps > 1
-                else 0
-            )
-            vel = int(
-                self.RAMP_MIN_VEL + ratio * (self.RAMP_MAX_VEL - self.RAMP_MIN_VEL)
-            )
-            return self._clamp_velocity(vel)
-
-        elif vel_mode == "ACCENT_FIRST":
-            if step_idx == 0:
-                return self.RAMP_MAX_VEL
-            else:
-                return self.RAMP_MIN_VEL
-
-        else:  # ORIGINAL or unknown
-            return self._clamp_velocity(state.velocity.fixed_velocity)
+        return self._vel_handlers[state.velocity.mode_id](step_idx, total_steps, state)
+
+    def produce_velocity(
+        self, note: int, step_idx: int, total_steps: int, state: ArpState
+    ) -> int:
+        """Calculate a note's velocity with its semitone accent applied.
+
+        Combines calculate_velocity, should_accent and _apply_accent in one
+        call for the per-step path.
+
+        Args:
+            note: MIDI note number being played
+            step_idx: Current position in the expanded note sequence
+            total_steps: Total number of notes in the expanded sequence
+            state: Current ArpState
+
+        Returns:
+            Velocity (0..127).
+        """
+        velocity = self._vel_handlers[state.velocity.mode_id](
+            step_idx, total_steps, state
+        )
+        if (state.pattern.accent_bits >> (note % 12)) & 1:
+            return self._ACCENT_LUT[velocity]
+        return velocity
+
+    def _vel_original(self, step_idx: int, total_steps: int, state: ArpState) -> int:
+        # VelocityConfig clamps fixed_velocity whenever it is assigned
+        return state.velocity.fixed_velocity
+
+    _vel_fixed = _vel_original
+
+    def _vel_ramp_up(self, step_idx: int, total_steps: int, state: ArpState) -> int:
+        return _ramp_table(total_steps, self.RAMP_MIN_VEL, self.RAMP_MAX_VEL)[step_idx]
+
+    def _vel_ramp_down(self, step_idx: int, total_steps: int, state: ArpState) -> int:
+        table = _ramp_table(total_steps, self.RAMP_MIN_VEL, self.RAMP_MAX_VEL)
+        return table[len(table) - 1 - step_idx]
+
+    def _vel_random(self, step_idx: int, total_steps: int, state: ArpState) -> int:
+        return self.RAMP_MIN_VEL + self._randbelow(self._RANDOM_SPAN)
+
+    def _vel_accent_first(
+        self, step_idx: int, total_steps: int, state: ArpState
+    ) -> int:
+        return self.RAMP_MAX_VEL if step_idx == 0 else self.RAMP_MIN_VEL
 
     def should_accent(self, note: int, state: ArpState) -> bool:
         """Check if a note should have an accent applied based on its semitone.
@@ -84,12 +139,7 @@ class NoteProducer:
         Returns:
             True if note should be accented.
         """
-        semitone = note % 12
-        return (
-            state.pattern.accents
-            and semitone < len(state.pattern.accents)
-            and state.pattern.accents[semitone]
-        )
+        return (state.pattern.accent_bits >> (note % 12)) & 1 == 1
 
     def _apply_accent(self, velocity: int) -> int:
         """Apply accent boost to velocity.
@@ -102,20 +152,7 @@ class NoteProducer:
         Returns:
             Accented velocity (0..127).
         """
-        accented = int(velocity * 1.25)
-        return self._clamp_velocity(accented)
-
-    @staticmethod
-    def _clamp_velocity(vel: int) -> int:
-        """Clamp velocity to valid MIDI range.
-
-        Args:
-            vel: Raw velocity value
-
-        Returns:
-            Velocity clamped to [0..127].
-        """
-        return max(0, min(127, int(vel)))
+        return self._ACCENT_LUT[velocity]
 
     def get_velocity_modes(self) -> list[str]:
         """Get list of supported velocity modes.
@@ -123,11 +160,4 @@ class NoteProducer:
         Returns:
             List of velocity mode strings.
         """
-        return [
-            "ORIGINAL",
-            "FIXED",
-            "RAMP_UP",
-            "RAMP_DOWN",
-            "RANDOM",
-            "ACCENT_FIRST",
-        ]
+        return list(VELOCITY_MODES)
@@ -1,9 +1,29 @@
 """ArpState validator with nested configuration objects and boundary checks."""
 
-from dataclasses import dataclass, field, asdict
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 import json
 
+from .timing import TimingCalculator
+
+
+def _build_pattern_table() -> Tuple[Tuple[bool, ...], ...]:
+    """Build the 12-step bool pattern for every possible 12-bit mask."""
+    table = []
+    for bits in range(4096):
+        steps = [False] * 12
+        # Visit only the set bits: isolate the lowest one, then clear it
+        while bits:
+            lsb = bits & -bits
+            steps[lsb.bit_length() - 1] = True
+            bits ^= lsb
+        table.append(tuple(steps))
+    return tuple(table)
+
+
+# Pattern views indexed by mask bits; only 2**12 masks exist
+_PATTERN_TABLE = _build_pattern_table()
+
 
 @dataclass
 class TimingConfig:
@@ -19,6 +39,15 @@ class TimingConfig:
         self.swing = self._validate_swing(self.swing)
         self.tempo_mul = max(0.1, min(4.0, self.tempo_mul))
 
+    def __setattr__(self, name: str, value) -> None:
+        # Normalize every division assignment (the GUI sets it directly) so
+        # the timing hot path can use the value as a DIVISION_MAP key as-is
+        if name == "division":
+            value = (value if isinstance(value, str) else "1/8").upper()
+            if value not in TimingCalculator.DIVISION_MAP:
+                value = "1/8"
+        object.__setattr__(self, name, value)
+
     @staticmethod
     def _validate_bpm(bpm: int) -> int:
         """Ensure BPM is within acceptable range."""
@@ -30,7 +59,12 @@ class TimingConfig:
         return max(0, min(75, int(swing)))
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "bpm": self.bpm,
+            "division": self.division,
+            "swing": self.swing,
+            "tempo_mul": self.tempo_mul,
+        }
 
     @classmethod
     def from_dict(cls, d: dict) -> "TimingConfig":
@@ -43,6 +77,17 @@ class TimingConfig:
         )
 
 
+VELOCITY_MODES = (
+    "ORIGINAL",
+    "FIXED",
+    "RAMP_UP",
+    "RAMP_DOWN",
+    "RANDOM",
+    "ACCENT_FIRST",
+)
+_VELOCITY_MODE_IDS = {mode: i for i, mode in enumerate(VELOCITY_MODES)}
+
+
 @dataclass
 class VelocityConfig:
     """Velocity-related configuration for arpeggiator."""
@@ -50,18 +95,17 @@ class VelocityConfig:
     mode: str = "ORIGINAL"  # ORIGINAL, FIXED, RAMP_UP, RAMP_DOWN, RANDOM, ACCENT_FIRST
     fixed_velocity: int = 100  # 0..127
 
-    def __post_init__(self) -> None:
-        valid_modes = {
-            "ORIGINAL",
-            "FIXED",
-            "RAMP_UP",
-            "RAMP_DOWN",
-            "RANDOM",
-            "ACCENT_FIRST",
-        }
-        if self.mode not in valid_modes:
-            self.mode = "ORIGINAL"
-        self.fixed_velocity = self._validate_velocity(self.fixed_velocity)
+    def __setattr__(self, name: str, value) -> None:
+        # Validate every assignment (the GUI sets both fields directly), so
+        # readers get an in-range int without clamping per step. mode_id,
+        # the index into VELOCITY_MODES, is kept in step with the string
+        if name == "mode":
+            if value not in _VELOCITY_MODE_IDS:
+                value = "ORIGINAL"
+            object.__setattr__(self, "mode_id", _VELOCITY_MODE_IDS[value])
+        elif name == "fixed_velocity":
+            value = self._validate_velocity(value)
+        object.__setattr__(self, name, value)
 
     @staticmethod
     def _validate_velocity(vel: int) -> int:
@@ -69,25 +113,61 @@ class VelocityConfig:
         return max(0, min(127, int(vel)))
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {"mode": self.mode, "fixed_velocity": self.fixed_velocity}
 
     @classmethod
     def from_dict(cls, d: dict) -> "VelocityConfig":
         return cls(**{k: v for k, v in d.items() if k in ("mode", "fixed_velocity")})
 
 
-@dataclass
+@dataclass(init=False)
 class PatternConfig:
-    """Pattern and accent configuration for arpeggiator."""
+    """Pattern and accent configuration for arpeggiator.
+
+    The 12-step mask and accents are stored as 12-bit ints (bit i = step i).
+    The ``mask`` and ``accents`` views are read-only tuples shared from a
+    precomputed table; change them by assignment or through the bits.
+    """
 
-    mask: List[bool] = field(default_factory=lambda: [True] * 12)
+    mask_bits: int = 0xFFF
     notes: List[int] = field(default_factory=list)
-    accents: List[bool] = field(default_factory=lambda: [False] * 12)
+    accent_bits: int = 0
+
+    def __init__(
+        self,
+        mask: Optional[List[bool]] = None,
+        notes: Optional[List[int]] = None,
+        accents: Optional[List[bool]] = None,
+        mask_bits: Optional[int] = None,
+        accent_bits: Optional[int] = None,
+    ) -> None:
+        if mask_bits is not None:
+            self.mask_bits = int(mask_bits) & 0xFFF
+        else:
+            self.mask_bits = self._pack(mask) if mask is not None else 0xFFF
+        self.notes = self._validate_notes(notes if notes is not None else [])
+        if accent_bits is not None:
+            self.accent_bits = int(accent_bits) & 0xFFF
+        else:
+            self.accent_bits = self._pack(accents) if accents is not None else 0
 
-    def __post_init__(self) -> None:
-        self.mask = self._validate_pattern(self.mask)
-        self.notes = self._validate_notes(self.notes)
-        self.accents = self._validate_pattern(self.accents)
+    @property
+    def mask(self) -> Tuple[bool, ...]:
+        """12-step mask as a tuple of bools (view of mask_bits)."""
+        return self._unpack(self.mask_bits)
+
+    @mask.setter
+    def mask(self, value: List[bool]) -> None:
+        self.mask_bits = self._pack(value)
+
+    @property
+    def accents(self) -> Tuple[bool, ...]:
+        """12-step accents as a tuple of bools (view of accent_bits)."""
+        return self._unpack(self.accent_bits)
+
+    @accents.setter
+    def accents(self, value: List[bool]) -> None:
+        self.accent_bits = self._pack(value)
 
     @staticmethod
     def _validate_notes(notes: List[int]) -> List[int]:
@@ -99,19 +179,70 @@ class PatternConfig:
     @staticmethod
     def _validate_pattern(pattern: List[bool]) -> List[bool]:
         """Ensure pattern is 12 elements of booleans."""
-        if not isinstance(pattern, list):
+        if not isinstance(pattern, (list, tuple)):
             return [True] * 12
         result = list(pattern)
         while len(result) < 12:
             result.append(False)
         return result[:12]
 
+    @classmethod
+    def _pack(cls, pattern: List[bool]) -> int:
+        """Pack a 12-step pattern into a bitmask (bit i = step i)."""
+        bits = 0
+        for i, v in enumerate(cls._validate_pattern(pattern)):
+            if v:
+                bits |= 1 << i
+        return bits
+
+    @staticmethod
+    def _unpack(bits: int) -> Tuple[bool, ...]:
+        """Unpack a 12-bit mask into a 12-element tuple of bools."""
+        return _PATTERN_TABLE[bits]
+
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "mask": list(self.mask),
+            "notes": self.notes,
+            "accents": list(self.accents),
+        }
 
     @classmethod
     def from_dict(cls, d: dict) -> "PatternConfig":
-        return cls(**{k: v for k, v in d.items() if k in ("mask", "notes", "accents")})
+        return cls(
+            **{
+                k: v
+                for k, v in d.items()
+                if k in ("mask", "notes", "accents", "mask_bits", "accent_bits")
+            }
+        )
+
+
+# Defaults for every key ArpState.from_dict reads (flat and nested formats)
+_ARP_DEFAULTS = {
+    "enabled": False,
+    "mode": "UP",
+    "octave": 1,
+    "octave_dir": "UP",
+    "latch": "OFF",
+    "external_sync": False,
+    "reset_mode": "NEW_CHORD",
+    "gate_pct": 50,
+    "held_notes": (),
+    "chord_memory": (),
+    "bpm": 120,
+    "division": "1/8",
+    "swing": 0,
+    "shift_tempo_mul": 1.0,
+    "velocity_mode": "ORIGINAL",
+    "fixed_velocity": 100,
+    "pattern_mask": None,
+    "pattern_notes": None,
+    "accents": None,
+    "timing": None,
+    "velocity": None,
+    "pattern": None,
+}
 
 
 @dataclass
@@ -197,9 +328,9 @@ class ArpState:
             "gate_pct": self.gate_pct,
             "velocity_mode": self.velocity.mode,
             "fixed_velocity": self.velocity.fixed_velocity,
-            "pattern_mask": self.pattern.mask,
+            "pattern_mask": list(self.pattern.mask),
             "pattern_notes": self.pattern.notes,
-            "accents": self.pattern.accents,
+            "accents": list(self.pattern.accents),
             "held_notes": list(self.held_notes),
             "chord_memory": self.chord_memory,
         }
@@ -211,56 +342,64 @@ class ArpState:
         Automatically detects old format (bpm, division, etc.) and converts
         to nested structure.
         """
-        # Handle new nested format
-        if "timing" in d and isinstance(d["timing"], dict):
-            timing_cfg = TimingConfig.from_dict(d["timing"])
+        # One merge supplies every flat-format default; nested configs,
+        # when present, take precedence over their flat keys
+        m = {**_ARP_DEFAULTS, **d}
+
+        timing = m["timing"]
+        if isinstance(timing, dict):
+            timing_cfg = TimingConfig.from_dict(timing)
         else:
             # Convert from old flat format
             timing_cfg = TimingConfig(
-                bpm=d.get("bpm", 120),
-                division=d.get("division", "1/8"),
-                swing=d.get("swing", 0),
-                tempo_mul=d.get("shift_tempo_mul", 1.0),
+                m["bpm"], m["division"], m["swing"], m["shift_tempo_mul"]
             )
 
-        if "velocity" in d and isinstance(d["velocity"], dict):
-            velocity_cfg = VelocityConfig.from_dict(d["velocity"])
+        velocity = m["velocity"]
+        if isinstance(velocity, dict):
+            velocity_cfg = VelocityConfig.from_dict(velocity)
         else:
-            velocity_cfg = VelocityConfig(
-                mode=d.get("velocity_mode", "ORIGINAL"),
-                fixed_velocity=d.get("fixed_velocity", 100),
-            )
+            velocity_cfg = VelocityConfig(m["velocity_mode"], m["fixed_velocity"])
 
-        if "pattern" in d and isinstance(d["pattern"], dict):
-            pattern_cfg = PatternConfig.from_dict(d["pattern"])
+        pattern = m["pattern"]
+        if isinstance(pattern, dict):
+            pattern_cfg = PatternConfig.from_dict(pattern)
         else:
             pattern_cfg = PatternConfig(
-                mask=d.get("pattern_mask", [True] * 12),
-                notes=d.get("pattern_notes", []),
-                accents=d.get("accents", [False] * 12),
+                m["pattern_mask"], m["pattern_notes"], m["accents"]
             )
 
         return cls(
-            enabled=d.get("enabled", False),
-            mode=d.get("mode", "UP"),
-            octave=d.get("octave", 1),
-            octave_dir=d.get("octave_dir", "UP"),
-            latch=d.get("latch", "OFF"),
-            external_sync=d.get("external_sync", False),
-            reset_mode=d.get("reset_mode", "NEW_CHORD"),
-            gate_pct=d.get("gate_pct", 50),
-            held_notes=set(d.get("held_notes", [])),
-            chord_memory=d.get("chord_memory", []),
+            enabled=m["enabled"],
+            mode=m["mode"],
+            octave=m["octave"],
+            octave_dir=m["octave_dir"],
+            latch=m["latch"],
+            external_sync=m["external_sync"],
+            reset_mode=m["reset_mode"],
+            gate_pct=m["gate_pct"],
+            held_notes=set(m["held_notes"]),
+            chord_memory=list(m["chord_memory"]),
             timing=timing_cfg,
             velocity=velocity_cfg,
             pattern=pattern_cfg,
         )
 
-    def save(self, path: str) -> None:
-        """Save state to JSON file."""
+    def save(self, path: str, pretty: bool = False) -> None:
+        """Save state to JSON file.
+
+        Args:
+            path: Destination file path
+            pretty: Indent the JSON for reading. The default compact form
+                goes through json's C encoder, which indenting disables.
+        """
+        if pretty:
+            text = json.dumps(self.to_dict(), indent=2)
+        else:
+            text = json.dumps(self.to_dict(), separators=(",", ":"))
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(self.to_dict(), f, indent=2)
+            with open(path, "wb") as f:
+                f.write(text.encode("utf-8"))
         except Exception:
             pass
 
@@ -5,10 +5,11 @@ to enable independent testing and reuse.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict
 
 
-@dataclass
+@dataclass(frozen=True)
 class TimingMetadata:
     """Calculated timing metadata for a single step."""
 
@@ -36,7 +37,13 @@ class TimingCalculator:
 
     def __init__(self) -> None:
         """Initialize timing calculator."""
-        pass
+        # Step timing depends only on a handful of scalars with step parity
+        # standing in for the step number, so results are memoized per instance
+        self._timing_cache = lru_cache(maxsize=256)(self._compute_timing)
+        # Unswung timing is the same for every step, so it skips the parity
+        self._straight_cache = lru_cache(maxsize=64)(self._compute_straight)
+        # Gate length is read every step but only changes with bpm/gate_pct
+        self._gate_cache = lru_cache(maxsize=64)(self._compute_gate_duration)
 
     def calculate_beat_interval(self, bpm: int) -> float:
         """Calculate seconds per beat from BPM.
@@ -57,14 +64,14 @@ class TimingCalculator:
 
         Args:
             beat_interval: Seconds per beat (from calculate_beat_interval)
-            division: Division string (1/4, 1/8, 1/16, 1/32, TRIPLET, DOTTED)
+            division: Division key (1/4, 1/8, 1/16, 1/32, TRIPLET, DOTTED),
+                already normalized by TimingConfig; unknown keys count as 1/8
             tempo_mul: Tempo multiplier (default 1.0), useful for humanization
 
         Returns:
             Seconds per step.
         """
-        div_upper = (division or "1/8").upper()
-        factor = self.DIVISION_MAP.get(div_upper, 0.5)
+        factor = self.DIVISION_MAP.get(division, 0.5)
 
         tempo_mul = max(0.0001, float(tempo_mul))
         return (beat_interval * factor) / tempo_mul
@@ -111,10 +118,35 @@ class TimingCalculator:
         Returns:
             TimingMetadata with interval, swing_delay, and total_sleep.
         """
+        if not swing_pct:
+            return self._straight_cache(bpm, division, tempo_mul)
+        return self._timing_cache(
+            bpm, division, swing_pct, step_number % 2 == 1, tempo_mul
+        )
+
+    def _compute_straight(
+        self, bpm: int, division: str, tempo_mul: float
+    ) -> TimingMetadata:
+        """Compute unswung timing metadata; backs the swing-free cache."""
         beat_interval = self.calculate_beat_interval(bpm)
         interval = self.calculate_step_interval(beat_interval, division, tempo_mul)
+        return TimingMetadata(
+            interval=interval,
+            swing_delay=0.0,
+            total_sleep=max(0.001, interval),
+        )
 
-        is_odd = (step_number % 2) == 1
+    def _compute_timing(
+        self,
+        bpm: int,
+        division: str,
+        swing_pct: int,
+        is_odd: bool,
+        tempo_mul: float,
+    ) -> TimingMetadata:
+        """Compute timing metadata; backs the calculate_timing cache."""
+        beat_interval = self.calculate_beat_interval(bpm)
+        interval = self.calculate_step_interval(beat_interval, division, tempo_mul)
         swing_delay = self.apply_swing(interval, swing_pct, is_odd)
 
         total_sleep = max(0.001, interval + swing_delay)
@@ -135,6 +167,10 @@ class TimingCalculator:
         Returns:
             Note duration in seconds.
         """
+        return self._gate_cache(bpm, gate_pct)
+
+    def _compute_gate_duration(self, bpm: int, gate_pct: int) -> float:
+        """Compute note duration; backs the calculate_gate_duration cache."""
         beat_interval = self.calculate_beat_interval(bpm)
         gate_pct = max(0, min(100, int(gate_pct)))
         return max(0.01, (gate_pct / 100.0) * beat_interval)
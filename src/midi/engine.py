@@ -93,36 +93,47 @@ class MidiEngine:
             await self.stop()
 
     async def _consume_queue(self):
-        """Worker task that pulls messages from the queue and sends them to output."""
+        """Worker task that pulls messages from the queue and sends them to output.
+
+        After each wakeup the queue is drained without awaiting, so a burst
+        (chord, harmony and arp notes together) is handled in one loop turn.
+        """
+        queue = self.queue
         while self._running:
             try:
-                msg = await self.queue.get()
-                processed_msg = self.processor.process(msg)
-
-                # Determine the underlying message for logging (unwrap wrapper if present)
-                original_msg = msg.msg if isinstance(msg, MidiMessageWrapper) else msg
-
-                if processed_msg:
-                    # Tap for sequencer recording (before sending to output)
-                    if self.sequencer:
-                        self.sequencer.record_message(processed_msg)
-                    else:
-                        logger.debug(
-                            f"Sequencer not available, skipping record_message"
-                        )
-
-                    if self.output:
-                        self.output.send(processed_msg)
-                else:
-                    logger.debug(
-                        f"Processor returned None for message type: {getattr(original_msg, 'type', 'unknown')}"
-                    )
-
-                self.queue.task_done()
+                msg = await queue.get()
             except asyncio.CancelledError:
                 break
-            except Exception as e:
-                logger.error(f"Error processing message: {e}")
+            while True:
+                try:
+                    self._handle_message(msg)
+                    queue.task_done()
+                except Exception as e:
+                    logger.error(f"Error processing message: {e}")
+                try:
+                    msg = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+
+    def _handle_message(self, msg) -> None:
+        """Process one queued message, record it and send it to the output."""
+        processed_msg = self.processor.process(msg)
+
+        if processed_msg:
+            # Tap for sequencer recording (before sending to output)
+            if self.sequencer:
+                self.sequencer.record_message(processed_msg)
+            else:
+                logger.debug(f"Sequencer not available, skipping record_message")
+
+            if self.output:
+                self.output.send(processed_msg)
+        else:
+            # Determine the underlying message for logging (unwrap wrapper if present)
+            original_msg = msg.msg if isinstance(msg, MidiMessageWrapper) else msg
+            logger.debug(
+                f"Processor returned None for message type: {getattr(original_msg, 'type', 'unknown')}"
+            )
 
     async def stop(self):
         self._running = False
@@ -1,15 +1,19 @@
 """Event logging for MIDI monitoring."""
 
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from collections import deque
+from itertools import islice
 from threading import Lock
 import mido
 
+from .scales import NOTE_NAMES
+
 logger = logging.getLogger(__name__)
 
-# MIDI note to note name mapping
-NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+# Name of every MIDI note 0..127 ("C-1" .. "G9"), built once
+_NOTE_NAME_TABLE = tuple(f"{NOTE_NAMES[n % 12]}{(n // 12) - 1}" for n in range(128))
 
 
 def midi_note_to_name(note_number: int) -> str:
@@ -21,17 +25,23 @@ def midi_note_to_name(note_number: int) -> str:
     Returns:
         Note name in format like "C4", "D#5", etc.
     """
-    if not 0 <= note_number <= 127:
-        return f"N{note_number}"
+    if 0 <= note_number <= 127:
+        return _NOTE_NAME_TABLE[note_number]
+    return f"N{note_number}"
+
 
-    octave = (note_number // 12) - 1
-    note = note_number % 12
-    return f"{NOTE_NAMES[note]}{octave}"
+# Wall-clock time paired with a monotonic reading, captured once at import;
+# events store only monotonic_ns() and are mapped onto the wall clock on demand
+_WALL_REF = datetime.now()
+_MONO_REF_NS = time.monotonic_ns()
+_ONE_US = timedelta(microseconds=1)
 
 
 class Event:
     """Represents a single MIDI event for logging."""
 
+    __slots__ = ("direction", "msg", "channel", "timestamp_ns")
+
     def __init__(self, direction: str, msg: mido.Message, channel: int = 0):
         """Initialize an event.
 
@@ -43,11 +53,31 @@ class Event:
         self.direction = direction
         self.msg = msg
         self.channel = channel
-        self.timestamp = datetime.now()
+        self.timestamp_ns = time.monotonic_ns()
+
+    @property
+    def timestamp(self) -> datetime:
+        """Wall-clock time of the event (derived from the monotonic stamp)."""
+        return _WALL_REF + timedelta(
+            microseconds=(self.timestamp_ns - _MONO_REF_NS) // 1000
+        )
+
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self.timestamp_ns = _MONO_REF_NS + (value - _WALL_REF) // _ONE_US * 1000
+
+    # "HH:MM:SS." prefix of the last formatted second, shared by all events
+    _prefix_second = None
+    _prefix = ""
 
     def format_time(self) -> str:
         """Format timestamp as HH:MM:SS.mmm"""
-        return self.timestamp.strftime("%H:%M:%S.%f")[:-3]
+        ts = self.timestamp
+        second = (ts.hour, ts.minute, ts.second)
+        if second != Event._prefix_second:
+            Event._prefix = ts.strftime("%H:%M:%S.")
+            Event._prefix_second = second
+        return f"{Event._prefix}{ts.microsecond // 1000:03d}"
 
     def format_event(self) -> str:
         """Format event for display.
@@ -95,7 +125,12 @@ class Event:
 
 
 class EventLog:
-    """Thread-safe event log for monitoring MIDI messages."""
+    """Thread-safe event log for monitoring MIDI messages.
+
+    add_event is lock-free: a single deque.append is atomic under the GIL,
+    and the bounded deque drops the oldest event by itself. The lock only
+    guards get_events and clear.
+    """
 
     def __init__(self, max_events: int = 50):
         """Initialize event log.
@@ -120,9 +155,8 @@ class EventLog:
         if self.paused:
             return
 
-        with self.lock:
-            event = Event(direction, msg, channel)
-            self.events.append(event)
+        event = Event(direction, msg, channel)
+        self.events.append(event)
 
         # Notify listeners
         for listener in self.event_listeners:
@@ -142,11 +176,12 @@ class EventLog:
             List of Event objects
         """
         with self.lock:
-            events = list(self.events)
-
-        if limit and len(events) > limit:
-            events = events[-limit:]
+            if not limit or limit >= len(self.events):
+                return list(self.events)
+            # Copy only the tail, walking back from the newest event
+            events = list(islice(reversed(self.events), limit))
 
+        events.reverse()
         return events
 
     def clear(self) -> None:
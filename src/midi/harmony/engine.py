@@ -56,9 +56,11 @@ class HarmonyEngine:
             0, min(127, harmony_velocity)
         )  # Clamp to valid MIDI range
 
-        # Send harmony note-ons
-        for h_note in allocated_harmonies:
-            self.dispatcher.send_note_on(h_note, harmony_velocity, channel)
+        # Send harmony note-ons in one enqueue
+        if allocated_harmonies:
+            self.dispatcher.send_note_ons(
+                allocated_harmonies, harmony_velocity, channel
+            )
 
     def process_melody_note_off(self, note: int, channel: int) -> None:
         """Process a melody note-off, send harmony note-offs."""
@@ -67,9 +69,9 @@ class HarmonyEngine:
 
         harmony_notes = self.voice_manager.deallocate_voices(note)
 
-        # Send harmony note-offs
-        for h_note in harmony_notes:
-            self.dispatcher.send_note_off(h_note, 0, channel)
+        # Send harmony note-offs in one enqueue
+        if harmony_notes:
+            self.dispatcher.send_note_offs(harmony_notes, channel)
 
     def panic(self) -> None:
         """Stop all harmony notes immediately.
@@ -81,8 +83,7 @@ class HarmonyEngine:
 
         # Send note-offs for all active harmony notes
         # We send on all channels since we don't track per-channel state
-        for melody_note, harmony_notes in active_voices.items():
-            for h_note in harmony_notes:
-                # Send on multiple channels to ensure coverage
-                for channel in range(16):
-                    self.dispatcher.send_note_off(h_note, 0, channel)
+        notes = [n for harmony_notes in active_voices.values() for n in harmony_notes]
+        if notes:
+            for channel in range(16):
+                self.dispatcher.send_note_offs(notes, channel)
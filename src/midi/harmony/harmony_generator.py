@@ -1,7 +1,10 @@
 """Harmony generator for creating harmony notes based on melody and scale context."""
 
-from typing import List
-from ..scales import ScaleType, snap_note_to_scale
+from typing import List, Tuple
+
+import numpy as np
+
+from ..scales import ScaleType, build_snap_table, snap_notes_bulk
 
 
 class HarmonyGenerator:
@@ -11,13 +14,28 @@ class HarmonyGenerator:
         self.intervals_above = intervals_above
         self.intervals_below = intervals_below or []
 
+    def __setattr__(self, name: str, value) -> None:
+        # Clamp both interval lists to 1..24 semitones on every assignment
+        # (the constructor included) and keep the signed offsets (above
+        # first, then below) in step with them. In range, the offsets fit
+        # one signed byte each
+        if name in ("intervals_above", "intervals_below"):
+            value = [max(1, min(24, i)) for i in value]
+        object.__setattr__(self, name, value)
+        if name in ("intervals_above", "intervals_below"):
+            offsets = tuple(getattr(self, "intervals_above", ())) + tuple(
+                -i for i in getattr(self, "intervals_below", ())
+            )
+            object.__setattr__(self, "_offsets", offsets)
+            object.__setattr__(self, "_offsets_arr", np.array(offsets, dtype=np.int8))
+
     def set_intervals_above(self, intervals: List[int]) -> None:
         """Update the upward harmony intervals."""
-        self.intervals_above = [max(1, min(24, i)) for i in intervals]
+        self.intervals_above = intervals
 
     def set_intervals_below(self, intervals: List[int]) -> None:
         """Update the downward harmony intervals."""
-        self.intervals_below = [max(1, min(24, i)) for i in intervals]
+        self.intervals_below = intervals
 
     def generate_harmony(
         self, melody_note: int, scale_root: int, scale_type: ScaleType
@@ -31,21 +49,33 @@ class HarmonyGenerator:
 
         Returns:
             List of harmony note pitches (0-127), snapped to scale tones.
+            Upward harmonies come first, then downward ones.
+        """
+        snap = build_snap_table(scale_root, scale_type)
+        return [
+            snap[n]
+            for n in [melody_note + offset for offset in self._offsets]
+            if 0 <= n <= 127
+        ]
+
+    def generate_harmony_batch(
+        self, melody_notes, scale_root: int, scale_type: ScaleType
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Generate harmony notes for several melody notes at once.
+
+        Args:
+            melody_notes: Sequence or array of melody notes (0-127)
+            scale_root: Root of the scale (0-11)
+            scale_type: ScaleType enum
+
+        Returns:
+            (snapped, valid): two (N, k) arrays for N melody notes and k
+            offsets, in generate_harmony's order. snapped holds the snapped
+            harmony notes (uint8); valid marks the ones inside 0-127. Row i
+            masked by valid[i] equals generate_harmony(melody_notes[i], ...).
         """
-        harmony_notes = []
-
-        # Generate upward harmonies
-        for interval in self.intervals_above:
-            harmony_note = melody_note + interval
-            if 0 <= harmony_note <= 127:
-                snapped_note = snap_note_to_scale(harmony_note, scale_root, scale_type)
-                harmony_notes.append(snapped_note)
-
-        # Generate downward harmonies
-        for interval in self.intervals_below:
-            harmony_note = melody_note - interval
-            if 0 <= harmony_note <= 127:
-                snapped_note = snap_note_to_scale(harmony_note, scale_root, scale_type)
-                harmony_notes.append(snapped_note)
-
-        return harmony_notes
+        notes = np.asarray(melody_notes, dtype=np.int16)
+        candidates = notes[:, None] + self._offsets_arr[None, :]
+        valid = (candidates >= 0) & (candidates <= 127)
+        snapped = snap_notes_bulk(candidates.clip(0, 127), scale_root, scale_type)
+        return snapped, valid
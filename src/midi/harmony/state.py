@@ -35,14 +35,19 @@ class HarmonyState:
         )
 
     def save(self, path):
-        with open(path, "w") as f:
-            json.dump(self.to_dict(), f)
+        with open(path, "wb") as f:
+            f.write(json.dumps(self.to_dict(), separators=(",", ":")).encode("utf-8"))
 
     @classmethod
     def load(cls, path):
+        # Missing, unreadable or malformed files (including valid JSON that
+        # is not an object) fall back to defaults; anything else is a bug
+        # and is left to surface
         try:
-            with open(path, "r") as f:
-                data = json.load(f)
-            return cls.from_dict(data)
-        except:
+            with open(path, "rb") as f:
+                data = json.loads(f.read())
+        except (OSError, ValueError):
             return cls()
+        if not isinstance(data, dict):
+            return cls()
+        return cls.from_dict(data)
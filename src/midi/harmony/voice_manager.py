@@ -1,6 +1,6 @@
 """Voice manager for tracking harmony voices and preventing overload."""
 
-from typing import Dict, List, Set
+from typing import Dict, Sequence, Tuple
 
 
 class VoiceManager:
@@ -8,54 +8,55 @@ class VoiceManager:
 
     def __init__(self, max_voices: int = 4):
         self.max_voices = max_voices
-        self.active_voices: Dict[int, List[int]] = (
-            {}
-        )  # melody_note -> list of harmony_notes
+        # melody_note -> tuple of harmony_notes
+        self.active_voices: Dict[int, Tuple[int, ...]] = {}
         self.voice_count = 0
 
     def set_max_voices(self, max_voices: int) -> None:
         """Update the maximum number of harmony voices."""
         self.max_voices = max(1, min(16, max_voices))
 
-    def allocate_voices(self, melody_note: int, harmony_notes: List[int]) -> List[int]:
+    def allocate_voices(
+        self, melody_note: int, harmony_notes: Sequence[int]
+    ) -> Tuple[int, ...]:
         """Allocate voices for harmony notes, respecting the limit.
 
-        Returns the list of harmony notes that can be allocated.
+        Returns the tuple of harmony notes that can be allocated (the
+        caller's tuple itself when it is passed one that fits).
         """
         available_slots = self.max_voices - self.voice_count
         if available_slots <= 0:
-            return []
+            return ()
 
-        allocated = harmony_notes[:available_slots]
+        if len(harmony_notes) > available_slots:
+            harmony_notes = harmony_notes[:available_slots]
+        allocated = tuple(harmony_notes)
         self.active_voices[melody_note] = allocated
         self.voice_count += len(allocated)
         return allocated
 
-    def deallocate_voices(self, melody_note: int) -> List[int]:
+    def deallocate_voices(self, melody_note: int) -> Tuple[int, ...]:
         """Deallocate voices for a melody note.
 
-        Returns the list of harmony notes that were active.
+        Returns the tuple of harmony notes that were active.
         """
-        if melody_note not in self.active_voices:
-            return []
-
-        harmony_notes = self.active_voices.pop(melody_note)
+        harmony_notes = self.active_voices.pop(melody_note, ())
         self.voice_count -= len(harmony_notes)
         return harmony_notes
 
-    def get_active_harmonies(self, melody_note: int) -> List[int]:
+    def get_active_harmonies(self, melody_note: int) -> Tuple[int, ...]:
         """Get currently active harmony notes for a melody note."""
-        return self.active_voices.get(melody_note, [])
+        return self.active_voices.get(melody_note, ())
 
-    def get_all_active_voices(self) -> Dict[int, List[int]]:
+    def get_all_active_voices(self) -> Dict[int, Tuple[int, ...]]:
         """Get all currently active voices.
 
         Returns:
-            Dictionary mapping melody_note -> list of harmony_notes
+            Dictionary mapping melody_note -> tuple of harmony_notes
         """
         return self.active_voices.copy()
 
-    def clear_all_voices(self) -> Dict[int, List[int]]:
+    def clear_all_voices(self) -> Dict[int, Tuple[int, ...]]:
         """Clear all active voices and return them.
 
         Returns:
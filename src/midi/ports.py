@@ -12,6 +12,7 @@ class PortManager:
     def __init__(self):
         self.system = platform.system()
         self._available_outputs = None  # Cache for available outputs
+        self._output_index = None  # Case-folded views of the outputs
 
     def get_input_names(self) -> list[str]:
         return mido.get_input_names()
@@ -27,9 +28,10 @@ class PortManager:
     ) -> list[str]:
         """Filters out system ports and specific output ports to prevent loops."""
         filtered = []
+        # Linux: Filter ALSA Through ports (platform checked once per call)
+        is_linux = self.system == "Linux"
         for name in input_names:
-            # Linux: Filter ALSA Through ports
-            if self.system == "Linux" and "Midi Through" in name:
+            if is_linux and "Midi Through" in name:
                 logger.debug(f"Filtering system port: {name}")
                 continue
 
@@ -47,11 +49,33 @@ class PortManager:
             filtered.append(name)
         return filtered
 
+    def _get_output_index(self) -> tuple[list[tuple[str, str]], dict[str, str]]:
+        """Case-folded views of the cached output names (built once).
+
+        Returns:
+            ([(lowered, name), ...] in port order, {lowered: first such name})
+        """
+        if self._output_index is None:
+            lowered = [(name.lower(), name) for name in self.get_output_names()]
+            exact = {}
+            for key, name in lowered:
+                exact.setdefault(key, name)
+            self._output_index = (lowered, exact)
+        return self._output_index
+
     def find_output_port(self, hint: str) -> str | None:
-        """Finds the first output port matching the hint (backward compatibility)."""
-        available = self.get_output_names()
-        for name in available:
-            if hint.lower() in name.lower():
+        """Finds the output port matching the hint (backward compatibility).
+
+        A port whose name equals the hint (ignoring case) wins; otherwise the
+        first port containing it.
+        """
+        lowered_names, exact = self._get_output_index()
+        hint = hint.lower()
+        name = exact.get(hint)
+        if name is not None:
+            return name
+        for lowered, name in lowered_names:
+            if hint in lowered:
                 return name
         return None
 
@@ -64,12 +88,13 @@ class PortManager:
         Returns:
             List of output port names that match any pattern, in order of pattern priority.
         """
-        available = self.get_output_names()
+        lowered_names, _ = self._get_output_index()
         matched_ports = []
 
         for pattern in patterns:
-            for name in available:
-                if pattern.lower() in name.lower() and name not in matched_ports:
+            needle = pattern.lower()
+            for lowered, name in lowered_names:
+                if needle in lowered and name not in matched_ports:
                     matched_ports.append(name)
                     logger.debug(f"Port matched pattern '{pattern}': {name}")
 
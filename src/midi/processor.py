@@ -1,14 +1,43 @@
 import mido
 import logging
 import time
+from bisect import insort
+from collections import deque
 from src.midi.arp.state_validator import ArpState
 from src.midi.harmony.state import HarmonyState
 from src.midi.message_wrapper import MidiMessageWrapper
-from src.midi.scales import ScaleType, snap_note_to_scale
+from src.midi.scales import ScaleType, build_snap_table
 from src.state import AppState
+from src.state.app_state import CLOCK_INTERVAL_WINDOW
 
 logger = logging.getLogger(__name__)
 
+# Message types checked per processed message
+_NOTE_TYPES = frozenset({"note_on", "note_off", "polytouch"})  # carry a note
+_NOTE_ONOFF = frozenset({"note_on", "note_off"})
+_CHANNEL_TYPES = frozenset(  # channel voice messages, the ones with a channel
+    {
+        "note_on",
+        "note_off",
+        "polytouch",
+        "control_change",
+        "program_change",
+        "aftertouch",
+        "pitchwheel",
+    }
+)
+# High-rate timing messages: never transformed and too chatty to log
+_TIMING_TYPES = frozenset({"clock", "active_sensing"})
+
+
+def _mirrors_held_notes(notes: list, held_notes: set) -> bool:
+    """Return True if notes is exactly held_notes in ascending order."""
+    return (
+        len(notes) == len(held_notes)
+        and all(a < b for a, b in zip(notes, notes[1:]))
+        and held_notes.issuperset(notes)
+    )
+
 
 class MidiProcessor:
     """Handles MIDI message transformation and routing logic."""
@@ -24,96 +53,110 @@ class MidiProcessor:
         self.config = config
         self.event_log = event_log
         self.app_state = app_state or AppState()
+        # Read per message; AppState keeps the same PerformanceState for life
+        self._perf = self.app_state.performance
+        # Snapped note per input note, rebuilt by the scale_root/type setters
+        self._rebuild_snap_table()
+        # Running total of clock_intervals, so the average is O(1) per tick
+        self._clock_sum = sum(self.clock_intervals)
         self.harmony_engine = None  # Will be set from context
         self.context = None
 
     @property
     def output_channel(self):
-        return self.app_state.performance.output_channel
+        return self._perf.output_channel
 
     @output_channel.setter
     def output_channel(self, value):
-        self.app_state.performance.output_channel = value
+        self._perf.output_channel = value
 
     @property
     def transpose(self):
-        return self.app_state.performance.transpose
+        return self._perf.transpose
 
     @transpose.setter
     def transpose(self, value):
-        self.app_state.performance.transpose = int(value)
+        self._perf.transpose = int(value)
 
     @property
     def octave(self):
-        return self.app_state.performance.octave
+        return self._perf.octave
 
     @octave.setter
     def octave(self, value):
-        self.app_state.performance.octave = int(value)
+        self._perf.octave = int(value)
 
     @property
     def fx_enabled(self):
-        return self.app_state.performance.fx_enabled
+        return self._perf.fx_enabled
 
     @fx_enabled.setter
     def fx_enabled(self, value):
-        self.app_state.performance.fx_enabled = bool(value)
+        self._perf.fx_enabled = bool(value)
 
     @property
     def harmonizer_enabled(self):
-        return self.app_state.performance.harmonizer_enabled
+        return self._perf.harmonizer_enabled
 
     @harmonizer_enabled.setter
     def harmonizer_enabled(self, value):
-        self.app_state.performance.harmonizer_enabled = bool(value)
+        self._perf.harmonizer_enabled = bool(value)
 
     @property
     def scale_enabled(self):
-        return self.app_state.performance.scale_enabled
+        return self._perf.scale_enabled
 
     @scale_enabled.setter
     def scale_enabled(self, value):
-        self.app_state.performance.scale_enabled = bool(value)
+        self._perf.scale_enabled = bool(value)
 
     @property
     def scale_root(self):
-        return self.app_state.performance.scale_root
+        return self._perf.scale_root
 
     @scale_root.setter
     def scale_root(self, value):
-        self.app_state.performance.scale_root = max(0, min(11, int(value)))
+        self._perf.scale_root = max(0, min(11, int(value)))
+        self._rebuild_snap_table()
 
     @property
     def scale_type(self):
-        return self.app_state.performance.scale_type
+        return self._perf.scale_type
 
     @scale_type.setter
     def scale_type(self, value):
         if isinstance(value, ScaleType):
-            self.app_state.performance.scale_type = value
+            self._perf.scale_type = value
         else:
             try:
-                self.app_state.performance.scale_type = ScaleType(value)
+                self._perf.scale_type = ScaleType(value)
             except Exception:
-                self.app_state.performance.scale_type = ScaleType.MAJOR
+                self._perf.scale_type = ScaleType.MAJOR
+        self._rebuild_snap_table()
+
+    def _rebuild_snap_table(self) -> None:
+        """Refresh the scale-snap table from the current root and scale type."""
+        self._snap_table = build_snap_table(
+            self._perf.scale_root, self._perf.scale_type
+        )
 
     @property
     def arp_enabled(self):
-        return self.app_state.performance.arp_enabled
+        return self._perf.arp_enabled
 
     @arp_enabled.setter
     def arp_enabled(self, value):
         enabled = bool(value)
-        self.app_state.performance.arp_enabled = enabled
+        self._perf.arp_enabled = enabled
         self.app_state.arp.enabled = enabled
 
     @property
     def multi_channel_enabled(self):
-        return self.app_state.performance.multi_channel_enabled
+        return self._perf.multi_channel_enabled
 
     @multi_channel_enabled.setter
     def multi_channel_enabled(self, value):
-        self.app_state.performance.multi_channel_enabled = bool(value)
+        self._perf.multi_channel_enabled = bool(value)
 
     @property
     def arp_state(self) -> ArpState:
@@ -122,7 +165,7 @@ class MidiProcessor:
     @arp_state.setter
     def arp_state(self, value: ArpState):
         self.app_state.arp = value
-        self.app_state.performance.arp_enabled = bool(getattr(value, "enabled", False))
+        self._perf.arp_enabled = bool(getattr(value, "enabled", False))
 
     @property
     def harmony_state(self) -> HarmonyState:
@@ -154,30 +197,43 @@ class MidiProcessor:
 
     @clock_intervals.setter
     def clock_intervals(self, value):
-        self.app_state.transport_io.clock_intervals = list(value)
+        intervals = deque(value, maxlen=CLOCK_INTERVAL_WINDOW)
+        self.app_state.transport_io.clock_intervals = intervals
+        self._clock_sum = sum(intervals)
 
     def process(self, msg) -> mido.Message | None:
         """
         Process an incoming MIDI message.
         Returns the message (possibly modified) to be sent, or None if it should be dropped.
         """
-        # Unwrap if it's a wrapper
-        if isinstance(msg, MidiMessageWrapper):
+        # Unwrap if it's a wrapper (nothing subclasses it, so an exact type
+        # check is enough and cheaper than isinstance)
+        if type(msg) is MidiMessageWrapper:
             original_msg = msg.msg
             is_arp = msg.is_arp
-            port = msg.port
         else:
             original_msg = msg
             is_arp = False
-            port = ""
 
-        # Ignore clock and sensing by default to reduce noise in logs
-        if self.verbose and original_msg.type not in ["clock", "active_sensing"]:
+        # Read the message type and performance settings once per message
+        msg_type = original_msg.type
+        perf = self._perf
+
+        # Fast path for clock and sensing: nothing below applies to them
+        if msg_type in _TIMING_TYPES:
+            # Handle clock for external sync
+            if msg_type == "clock" and self.arp_state.external_sync:
+                self._handle_clock()
+            if self.event_log:
+                self.event_log.add_event("out", original_msg, 0)
+            return original_msg
+
+        if self.verbose:
             logger.info(f"Processing: {original_msg}")
 
         # Handle MIDI Panic (CC 123 - All Notes Off)
         if (
-            original_msg.type == "control_change"
+            msg_type == "control_change"
             and original_msg.control == 123
             and original_msg.value == 0
         ):
@@ -185,115 +241,148 @@ class MidiProcessor:
             # Still pass through the CC 123 message to MIDI output
             return original_msg
 
-        # Handle clock for external sync
-        if original_msg.type == "clock" and self.arp_state.external_sync:
-            self._handle_clock()
-
-        # Clone message to avoid side effects on the original
         if original_msg.is_meta:
             return original_msg
 
-        new_msg = original_msg.copy()
+        # Copied only before its first change ("new_msg is original_msg"
+        # until then), so pass-through messages are never cloned
+        new_msg = original_msg
+        has_note = msg_type in _NOTE_TYPES
+        is_input_onoff = not is_arp and msg_type in _NOTE_ONOFF
 
         # Apply scale snapping FIRST for input notes (before arp/harmony processing)
-        if (
-            self.scale_enabled
-            and new_msg.type in ["note_on", "note_off", "polytouch"]
-            and not is_arp
-        ):
-            new_msg.note = snap_note_to_scale(
-                new_msg.note, self.scale_root, self.scale_type
-            )
+        if perf.scale_enabled and has_note and not is_arp:
+            snapped = self._snap_table[new_msg.note]
+            if snapped != new_msg.note:
+                new_msg = new_msg.copy()
+                new_msg.note = snapped
 
         # Handle harmonizer
-        if self.harmonizer_enabled and self.harmony_engine and not is_arp:
-            if new_msg.type in ["note_on", "note_off"]:
-                self._process_melody_note(new_msg)
+        if is_input_onoff and perf.harmonizer_enabled and self.harmony_engine:
+            self._process_melody_note(new_msg)
 
-        # Handle arpeggiator input notes (only real input, not arp-generated)
-        if self.arp_enabled and new_msg.type in ["note_on", "note_off"] and not is_arp:
+        # Handle arpeggiator input notes (only real input, not arp-generated),
+        # then drop them (only allow arp-generated notes)
+        if is_input_onoff and perf.arp_enabled:
             self._update_arp_notes(new_msg)
-
-        # Drop input notes when arp is enabled (only allow arp-generated notes)
-        if new_msg.type in ["note_on", "note_off"] and self.arp_enabled and not is_arp:
             return None
 
         # Apply transformations for note messages
-        if new_msg.type in ["note_on", "note_off", "polytouch"]:
+        if has_note:
             # Transposition and Octave
-            shift = self.transpose + (self.octave * 12)
+            shift = perf.shift
             if shift != 0:
                 new_note = new_msg.note + shift
                 if 0 <= new_note <= 127:
+                    if new_msg is original_msg:
+                        new_msg = new_msg.copy()
                     new_msg.note = new_note
                 else:
                     return None  # Drop if out of MIDI range
 
         # Apply channel mapping
-        if self.output_channel is not None and hasattr(new_msg, "channel"):
-            new_msg.channel = self.output_channel
-
-        # MultiChannel mapping: map pitch class to channels 0..11 (C->0, C#->1, ..., B->11)
-        # This overrides any global output_channel when enabled.
+        output_channel = perf.output_channel
         if (
-            getattr(self, "multi_channel_enabled", False)
-            and new_msg.type in ["note_on", "note_off", "polytouch"]
-            and hasattr(new_msg, "channel")
+            output_channel is not None
+            and msg_type in _CHANNEL_TYPES
+            and new_msg.channel != output_channel
         ):
-            try:
-                mapped = int(new_msg.note) % 12
+            if new_msg is original_msg:
+                new_msg = new_msg.copy()
+            new_msg.channel = output_channel
+
+        # MultiChannel mapping: map pitch class to channels 0..11 (C->0, C#->1, ..., B->11)
+        # This overrides any global output_channel when enabled (every note
+        # type is a channel message, so no channel check is needed).
+        if perf.multi_channel_enabled and has_note:
+            mapped = new_msg.note % 12
+            if mapped != new_msg.channel:
+                if new_msg is original_msg:
+                    new_msg = new_msg.copy()
                 new_msg.channel = mapped
-            except Exception:
-                # If there's no note attribute or conversion fails, skip mapping
-                pass
 
-        # Log outgoing event
-        if new_msg and self.event_log:
-            channel = getattr(new_msg, "channel", 0)
+        # Log outgoing event (new_msg is never None here; testing its truth
+        # would call mido's __len__)
+        if self.event_log:
+            channel = new_msg.channel if msg_type in _CHANNEL_TYPES else 0
             self.event_log.add_event("out", new_msg, channel)
 
         return new_msg
 
     def _update_arp_notes(self, msg: mido.Message) -> None:
-        """Update held notes for arpeggiator based on input."""
+        """Update held notes for arpeggiator based on input.
+
+        pattern.notes mirrors held_notes in sorted order, so while the two
+        agree one added or released note is inserted into or removed from it
+        in place. If they have drifted apart (e.g. a loaded preset), it is
+        rebuilt.
+        """
+        arp_state = self.arp_state
+        held_notes = arp_state.held_notes
+        notes = arp_state.pattern.notes
+        note = msg.note
         if msg.type == "note_on" and msg.velocity > 0:
-            self.arp_state.held_notes.add(msg.note)
-            logger.debug(
-                f"AR note added: {msg.note}, held_notes now: {sorted(self.arp_state.held_notes)}"
-            )
-            self._update_arp_pattern()
+            in_sync = _mirrors_held_notes(notes, held_notes)
+            if note in held_notes:
+                if not in_sync:
+                    self._update_arp_pattern()
+                return
+            held_notes.add(note)
+            action = "added"
+            if in_sync:
+                insort(notes, note)
+            else:
+                self._update_arp_pattern()
         elif msg.type == "note_off" or (msg.type == "note_on" and msg.velocity == 0):
-            if self.arp_state.latch != "HOLD":
-                self.arp_state.held_notes.discard(msg.note)
-                logger.debug(
-                    f"AR note removed: {msg.note}, held_notes now: {sorted(self.arp_state.held_notes)}"
-                )
+            if arp_state.latch == "HOLD":
+                return
+            in_sync = _mirrors_held_notes(notes, held_notes)
+            if note not in held_notes:
+                if not in_sync:
+                    self._update_arp_pattern()
+                return
+            held_notes.discard(note)
+            action = "removed"
+            if in_sync:
+                notes.remove(note)
+            else:
                 self._update_arp_pattern()
+        else:
+            return
+        # pattern.notes is the sorted held set; no extra sort just to log it
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"AR note {action}: {note}, pattern.notes now: {arp_state.pattern.notes}"
+            )
 
     def _update_arp_pattern(self) -> None:
-        """Update arpeggiator pattern from held notes."""
+        """Rebuild the arpeggiator pattern from all held notes."""
         # Sync held_notes to pattern.notes so the arp engine can generate from them
-        self.arp_state.pattern.notes = sorted(list(self.arp_state.held_notes))
-        logger.debug(f"AR pattern.notes updated: {self.arp_state.pattern.notes}")
+        self.arp_state.pattern.notes = sorted(self.arp_state.held_notes)
 
     def _handle_clock(self) -> None:
         """Handle MIDI clock message for external sync."""
         current_time = time.time()
-        if self.last_clock_time is not None:
-            interval = current_time - self.last_clock_time
-            self.clock_intervals.append(interval)
-            if len(self.clock_intervals) > 24:  # Keep last 24 intervals
-                self.clock_intervals.pop(0)
-            if len(self.clock_intervals) >= 6:  # Need some samples
-                avg_interval = sum(self.clock_intervals) / len(self.clock_intervals)
-                quarter_time = avg_interval * 24  # 24 clocks per quarter
-                bpm = 60.0 / quarter_time
+        transport = self.app_state.transport_io
+        last_clock_time = transport.last_clock_time
+        if last_clock_time is not None:
+            interval = current_time - last_clock_time
+            intervals = transport.clock_intervals
+            # The bounded deque drops the oldest interval; drop it from the sum
+            if len(intervals) == intervals.maxlen:
+                self._clock_sum -= intervals[0]
+            intervals.append(interval)
+            self._clock_sum += interval
+            count = len(intervals)
+            if count >= 6:  # Need some samples
+                # 60 / (average interval * 24 clocks per quarter)
+                bpm = 2.5 * count / self._clock_sum
                 clamped_bpm = int(max(20, min(300, bpm)))
                 if self.context and hasattr(self.context, "set_global_tempo"):
                     self.context.set_global_tempo(clamped_bpm)
                 else:
                     self.arp_state.timing.bpm = clamped_bpm
-        self.last_clock_time = current_time
+        transport.last_clock_time = current_time
 
     def _handle_panic(self) -> None:
         """Handle MIDI panic (CC 123 - All Notes Off).
@@ -2,6 +2,9 @@
 
 from typing import List, Dict
 from enum import Enum
+from functools import lru_cache
+
+import numpy as np
 
 
 class ScaleType(Enum):
@@ -49,46 +52,48 @@ def get_scale_notes(root: int, scale_type: ScaleType) -> List[int]:
     return [(note + root) % 12 for note in intervals]
 
 
+@lru_cache(maxsize=None)
+def _scale_mask(root: int, scale_type: ScaleType) -> int:
+    """12-bit mask of the scale's pitch classes (bit i set for semitone i)."""
+    mask = 0
+    for pitch_class in get_scale_notes(root, scale_type):
+        mask |= 1 << pitch_class
+    return mask
+
+
 def snap_note_to_scale(note: int, root: int, scale_type: ScaleType) -> int:
     """
     Snap a MIDI note (0-127) to the nearest note in the scale.
-    Considers adjacent octaves to prevent large jumps.
+    Walks outward from the note (0, +1, -1, +2, -2, ...), so the nearest
+    scale note wins across octave boundaries and ties go upward.
     Returns the snapped note number.
     """
-    note_mod12 = note % 12
-    octave = note // 12
-    scale_notes = get_scale_notes(root, scale_type)
-
-    # Candidate notes in current octave and adjacent octaves
-    candidates_with_octaves = []
-
-    for scale_note in scale_notes:
-        # Check current octave
-        snapped = octave * 12 + scale_note
-        if 0 <= snapped <= 127:
-            distance = abs(note - snapped)
-            candidates_with_octaves.append((distance, snapped))
-
-        # Check octave above
-        snapped_up = (octave + 1) * 12 + scale_note
-        if snapped_up <= 127:
-            distance = abs(note - snapped_up)
-            candidates_with_octaves.append((distance, snapped_up))
-
-        # Check octave below
-        snapped_down = (octave - 1) * 12 + scale_note
-        if snapped_down >= 0:
-            distance = abs(note - snapped_down)
-            candidates_with_octaves.append((distance, snapped_down))
-
-    if not candidates_with_octaves:
-        return note  # Fallback: return original if no valid snaps
-
-    # Find minimum distance; if tied, prefer upward (higher note)
-    min_distance = min(c[0] for c in candidates_with_octaves)
-    candidates_at_min = [c[1] for c in candidates_with_octaves if c[0] == min_distance]
-
-    return max(candidates_at_min)  # Upward bias: choose highest candidate
+    mask = _scale_mask(root, scale_type)
+    for distance in range(12):
+        for candidate in (note + distance, note - distance):
+            if 0 <= candidate <= 127 and mask >> (candidate % 12) & 1:
+                return candidate
+    return note  # Fallback: return original if no valid snaps
+
+
+@lru_cache(maxsize=None)
+def build_snap_table(root: int, scale_type: ScaleType) -> bytes:
+    """Snapped note for every MIDI note 0-127, for the given scale.
+
+    Index the result with a note number instead of calling
+    snap_note_to_scale per note. Tables are cached per (root, scale_type).
+    """
+    return bytes(snap_note_to_scale(n, root, scale_type) for n in range(128))
+
+
+def snap_notes_bulk(notes, root: int, scale_type: ScaleType) -> np.ndarray:
+    """Snap an array of MIDI notes (0-127) to the scale in one table lookup.
+
+    Returns a uint8 array shaped like ``notes``; element-wise equal to
+    snap_note_to_scale.
+    """
+    table = np.frombuffer(build_snap_table(root, scale_type), dtype=np.uint8)
+    return table[notes]
 
 
 def get_scale_display_name(root: int, scale_type: ScaleType) -> str:
@@ -16,7 +16,7 @@ class InternalClock:
     """High-resolution async MIDI clock using PPQN=960
 
     Responsibilities:
-    - Maintain precise timing using monotonic time + drift correction
+    - Maintain precise timing against absolute monotonic tick deadlines
     - Convert BPM → ticks per second
     - Emit tick callbacks (_on_tick, _on_bar_start, _on_beat)
     - Run on the asyncio event loop (integrates with existing architecture)
@@ -27,6 +27,7 @@ class InternalClock:
     """
 
     PPQN = 960  # Pulses per quarter note
+    MIN_SLEEP = 0.001  # Shortest wait between wakes (seconds)
 
     def __init__(self, sequencer):
         """Initialize clock
@@ -38,8 +39,7 @@ class InternalClock:
         self.state = sequencer.state
 
         self._task = None
-        self._last_monotonic = 0.0
-        self._accumulated_ticks = 0.0
+        self._next_tick_time = 0.0
         self._is_running = False
 
     async def start(self):
@@ -48,10 +48,8 @@ class InternalClock:
             return
 
         self._is_running = True
-        # _last_monotonic is set inside _run_clock to avoid first-frame burst
+        # _next_tick_time is set inside _run_clock to avoid first-frame burst
         # caused by delay between create_task and actual task execution
-        self._accumulated_ticks = 0.0
-
         self._task = asyncio.create_task(self._run_clock())
         logger.debug(f"Sequencer clock started (BPM={self.state.tempo})")
 
@@ -71,78 +69,38 @@ class InternalClock:
         logger.debug("Sequencer clock stopped")
 
     async def _run_clock(self):
-        """Main clock loop: maintain precise timing and emit tick callbacks
+        """Main clock loop: dispatch ticks against absolute deadlines
 
         Algorithm:
-        1. Measure elapsed time since last iteration using monotonic()
-        2. Convert elapsed time to ticks using current BPM
-        3. Accumulate fractional ticks
-        4. Dispatch all complete ticks as callbacks
-        5. Sleep ~1ms to avoid busy-loop CPU usage
-
-        Drift correction: accumulating fractional ticks ensures timing stays
-        synchronized even if sleep intervals are inexact.
+        1. Keep the absolute monotonic time the next tick is due
+        2. On each wake, dispatch every tick whose deadline has passed and
+           advance the deadline by one tick length (at the current BPM) each
+        3. Sleep until the next deadline, but at least MIN_SLEEP, so fast
+           tempos are handled in small batches rather than a wake per tick
+
+        Drift correction: deadlines advance by exact tick lengths rather
+        than by measured sleep times, so inexact sleeps never accumulate.
         """
-        # Set initial time reference HERE (not in start()) to avoid
-        # a burst of ticks from the asyncio scheduling delay
-        self._last_monotonic = monotonic()
+        state = self.state
 
-        # Seed 1.0 accumulated tick so tick 0 fires immediately on the
-        # first frame instead of waiting for the first sleep cycle.
-        self._accumulated_ticks = 1.0
+        # Set initial time reference HERE (not in start()) to avoid
+        # a burst of ticks from the asyncio scheduling delay.
+        # Tick 0 is due immediately, on the first frame.
+        self._next_tick_time = monotonic()
 
         try:
             while self._is_running:
                 try:
                     now = monotonic()
-                    dt = now - self._last_monotonic
-                    self._last_monotonic = now
-
-                    # Convert elapsed time to ticks
-                    bpm = self.state.tempo
-                    seconds_per_quarter = 60.0 / bpm
-                    seconds_per_tick = seconds_per_quarter / self.PPQN
-                    ticks_this_frame = dt / seconds_per_tick
-
-                    self._accumulated_ticks += ticks_this_frame
-
-                    # Dispatch complete ticks one-by-one to avoid skipping
-                    # beat/bar boundaries when dt produces multiple ticks.
-                    while self._accumulated_ticks >= 1:
-                        self._accumulated_ticks -= 1
-
-                        # Fire the main tick callback BEFORE incrementing
-                        # This ensures tick 0 plays on the first iteration
-                        self.sequencer._on_tick(self.state.current_tick)
-
-                        # Update playhead position by exactly one tick
-                        self.state.current_tick = (
-                            self.state.current_tick + 1
-                        ) % self.state.loop_length_ticks
-
-                        # Check for bar start (reset to 0)
-                        if (
-                            self.state.current_tick == 0
-                            and self.state.loop_length_ticks > 0
-                        ):
-                            self.sequencer._on_bar_start()
-
-                        # Check for beat start
-                        ticks_per_beat = self.PPQN * (4 / self.state.time_signature_den)
-                        if (
-                            ticks_per_beat > 0
-                            and self.state.current_tick % ticks_per_beat == 0
-                        ):
-                            beat_index = (
-                                int(self.state.current_tick / ticks_per_beat)
-                                % self.state.time_signature_num
-                            )
-                            self.sequencer._on_beat(beat_index)
-
-                    # Small sleep to prevent 100% CPU usage
-                    # Vary sleep based on accumulated ticks to maintain precision
-                    sleep_time = max(0.0001, 0.001 - self._accumulated_ticks * 0.0001)
-                    await asyncio.sleep(sleep_time)
+                    if now >= self._next_tick_time:
+                        seconds_per_tick = 60.0 / (state.tempo * self.PPQN)
+                        due = int((now - self._next_tick_time) / seconds_per_tick) + 1
+                        self._next_tick_time += due * seconds_per_tick
+                        self._dispatch_ticks(due)
+
+                    await asyncio.sleep(
+                        max(self.MIN_SLEEP, self._next_tick_time - monotonic())
+                    )
 
                 except Exception as e:
                     logger.error(f"Clock tick error: {e}", exc_info=True)
@@ -152,6 +110,46 @@ class InternalClock:
             logger.debug("Clock task cancelled")
             raise
 
+    def _dispatch_ticks(self, count: int):
+        """Dispatch count ticks, one by one
+
+        Ticks are dispatched singly to avoid skipping beat/bar boundaries
+        when a frame produces several. Time signature and loop length are
+        read once per frame: they change between frames, not within one.
+        """
+        state = self.state
+        sequencer = self.sequencer
+        loop_length = state.loop_length_ticks
+        beats_per_bar = state.time_signature_num
+        ticks_per_beat = self._ticks_per_beat(state.time_signature_den)
+
+        for _ in range(count):
+            # Fire the main tick callback BEFORE incrementing
+            # This ensures tick 0 plays on the first iteration
+            sequencer._on_tick(state.current_tick)
+
+            # Update playhead position by exactly one tick
+            tick = (state.current_tick + 1) % loop_length
+            state.current_tick = tick
+
+            # Check for bar start (reset to 0)
+            if tick == 0 and loop_length > 0:
+                sequencer._on_bar_start()
+
+            # Check for beat start
+            if ticks_per_beat > 0 and tick % ticks_per_beat == 0:
+                sequencer._on_beat(int(tick // ticks_per_beat) % beats_per_bar)
+
+    @classmethod
+    def _ticks_per_beat(cls, den: int):
+        """Ticks per beat for a time-signature denominator
+
+        An int for the usual denominators (2, 4, 8, 16), so beat checks use
+        integer modulo; a float only for ones that don't divide PPQN * 4.
+        """
+        ticks, remainder = divmod(cls.PPQN * 4, den)
+        return ticks if remainder == 0 else cls.PPQN * 4 / den
+
     def is_running(self) -> bool:
         """Check if clock is actively running"""
         return self._is_running
@@ -4,10 +4,26 @@ Patterns store absolute tick positions relative to the loop start.
 Uses PPQN=960 for high precision.
 """
 
+from bisect import bisect_left, insort
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 import mido
 
+# Message fields saved with a pattern event, in this order, when present
+_SAVED_FIELDS = ("note", "velocity", "channel", "control", "value")
+
+# Message type -> the _SAVED_FIELDS it has, filled in as types are seen
+_FIELDS_BY_TYPE: Dict[str, Tuple[str, ...]] = {}
+
+
+def _saved_fields(msg: mido.Message) -> Tuple[str, ...]:
+    """Return the saved fields present on messages of msg's type"""
+    fields = _FIELDS_BY_TYPE.get(msg.type)
+    if fields is None:
+        fields = tuple(name for name in _SAVED_FIELDS if hasattr(msg, name))
+        _FIELDS_BY_TYPE[msg.type] = fields
+    return fields
+
 
 @dataclass
 class PatternEvent:
@@ -24,30 +40,13 @@ class PatternEvent:
     def to_dict(self) -> dict:
         """Serialize event to dictionary for JSON storage"""
         msg = self.message
-        event_dict = {
-            "tick": self.tick,
-            "message": {
-                "type": msg.type,
-            },
-        }
+        message_dict = {"type": msg.type}
 
         # Add optional fields based on message type
-        if hasattr(msg, "note"):
-            event_dict["message"]["note"] = msg.note
-
-        if hasattr(msg, "velocity"):
-            event_dict["message"]["velocity"] = msg.velocity
-
-        if hasattr(msg, "channel"):
-            event_dict["message"]["channel"] = msg.channel
-
-        if hasattr(msg, "control"):
-            event_dict["message"]["control"] = msg.control
+        for name in _saved_fields(msg):
+            message_dict[name] = getattr(msg, name)
 
-        if hasattr(msg, "value"):
-            event_dict["message"]["value"] = msg.value
-
-        return event_dict
+        return {"tick": self.tick, "message": message_dict}
 
     @classmethod
     def from_dict(cls, data: dict) -> "PatternEvent":
@@ -71,21 +70,58 @@ class Pattern:
 
     Stores events as a list of PatternEvents with absolute tick positions.
     Supports quantization, loop wrapping, and JSON serialization.
+
+    Events are also indexed by tick (with the distinct ticks kept sorted)
+    for playback and range lookups, so add them with add_event rather than
+    appending to ``events`` directly.
     """
 
     events: List[PatternEvent] = field(default_factory=list)
+    _by_tick: Dict[int, List[PatternEvent]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _ticks: List[int] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        for event in self.events:
+            self._index(event)
 
     def add_event(self, tick: int, message: mido.Message):
         """Add a MIDI message to the pattern at the specified tick"""
-        self.events.append(PatternEvent(tick, message))
+        self._append(PatternEvent(tick, message))
+
+    def _append(self, event: PatternEvent):
+        self.events.append(event)
+        self._index(event)
+
+    def _index(self, event: PatternEvent):
+        at_tick = self._by_tick.get(event.tick)
+        if at_tick is None:
+            self._by_tick[event.tick] = [event]
+            insort(self._ticks, event.tick)
+        else:
+            at_tick.append(event)
 
     def clear(self):
         """Remove all events from the pattern"""
         self.events.clear()
-
-    def events_at_tick(self, tick: int) -> List[PatternEvent]:
-        """Return all events due to play at a specific tick"""
-        return [e for e in self.events if e.tick == tick]
+        self._by_tick.clear()
+        self._ticks.clear()
+
+    def events_at_tick(self, tick: int) -> Sequence[PatternEvent]:
+        """Return all events due to play at a specific tick (read-only)"""
+        return self._by_tick.get(tick, ())
+
+    def events_in_range(self, start: int, end: int) -> List[PatternEvent]:
+        """Return events with start <= tick < end, ordered by tick"""
+        ticks = self._ticks
+        by_tick = self._by_tick
+        events = []
+        for tick in ticks[bisect_left(ticks, start) : bisect_left(ticks, end)]:
+            events.extend(by_tick[tick])
+        return events
 
     def is_empty(self) -> bool:
         """Check if pattern has any events"""
@@ -97,15 +133,11 @@ class Pattern:
 
     def get_first_tick(self) -> Optional[int]:
         """Return the tick of the first event, or None if empty"""
-        if not self.events:
-            return None
-        return min(e.tick for e in self.events)
+        return self._ticks[0] if self._ticks else None
 
     def get_last_tick(self) -> Optional[int]:
         """Return the tick of the last event, or None if empty"""
-        if not self.events:
-            return None
-        return max(e.tick for e in self.events)
+        return self._ticks[-1] if self._ticks else None
 
     def quantize_event(self, tick: int, grid_ticks: int) -> int:
         """Quantize a tick to the nearest grid position
@@ -130,7 +162,7 @@ class Pattern:
         """Deserialize pattern from list of event dicts"""
         pattern = cls()
         for event_data in data:
-            pattern.events.append(PatternEvent.from_dict(event_data))
+            pattern._append(PatternEvent.from_dict(event_data))
         return pattern
 
     def to_midi_file(
@@ -165,17 +197,15 @@ class Pattern:
             )
         )
 
-        # Sort events by tick position
-        sorted_events = sorted(self.events, key=lambda e: e.tick)
-
-        # Convert absolute ticks to delta times
+        # Convert absolute ticks to delta times, walking the sorted tick
+        # index (events at one tick keep their recording order)
         last_tick = 0
-        for event in sorted_events:
-            delta = event.tick - last_tick
-            # Create new message with delta time
-            msg = event.message.copy(time=delta)
-            track.append(msg)
-            last_tick = event.tick
+        by_tick = self._by_tick
+        for tick in self._ticks:
+            for event in by_tick[tick]:
+                # Create new message with delta time
+                track.append(event.message.copy(time=tick - last_tick))
+                last_tick = tick
 
         # Add end of track meta message
         track.append(mido.MetaMessage("end_of_track", time=0))
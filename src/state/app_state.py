@@ -1,5 +1,6 @@
 """Centralized state model for the MIDI Echo application."""
 
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Optional, TYPE_CHECKING
 
@@ -17,10 +18,17 @@ def _default_sequencer_state() -> "SequencerState":
     return SequencerState()
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceState:
-    """Musical/performance transformation state."""
+    """Musical/performance transformation state.
+
+    Slotted: MidiProcessor reads these fields for every message.
+    """
 
+    # Note shift in semitones (transpose + 12 * octave), kept in step with
+    # both fields by __setattr__ so the processor reads one int per note.
+    # Declared first so __init__ resets it before transpose/octave are set
+    shift: int = field(default=0, init=False, repr=False, compare=False)
     output_channel: Optional[int] = None
     transpose: int = 0
     octave: int = 0
@@ -32,6 +40,23 @@ class PerformanceState:
     arp_enabled: bool = False
     multi_channel_enabled: bool = False
 
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        if name == "transpose" or name == "octave":
+            object.__setattr__(
+                self,
+                "shift",
+                getattr(self, "transpose", 0) + 12 * getattr(self, "octave", 0),
+            )
+
+
+# MIDI clock intervals kept for tempo estimation (one quarter note)
+CLOCK_INTERVAL_WINDOW = 24
+
+
+def _clock_interval_buffer() -> deque:
+    return deque(maxlen=CLOCK_INTERVAL_WINDOW)
+
 
 @dataclass
 class TransportIOState:
@@ -39,7 +64,7 @@ class TransportIOState:
 
     error_state: bool = False
     last_clock_time: Optional[float] = None
-    clock_intervals: list[float] = field(default_factory=list)
+    clock_intervals: deque[float] = field(default_factory=_clock_interval_buffer)
 
 
 @dataclass
@@ -1,5 +1,6 @@
 """Tests for MidiDispatcher module."""
 
+import asyncio
 import pytest
 from unittest.mock import Mock, MagicMock, call
 from src.midi.arp.dispatcher import MidiDispatcher
@@ -92,6 +93,31 @@ class TestMidiDispatcher:
         message = wrapped.msg
         assert message.velocity == 0
 
+    def test_send_note_pair(self):
+        """Test note_on is sent now and note_off is scheduled on the loop."""
+        engine = MockMidiEngine(has_queue=True)
+        dispatcher = MidiDispatcher(engine)
+        loop = Mock()
+
+        handle = dispatcher.send_note_pair(60, 100, 0.25, loop, channel=2)
+
+        assert handle is loop.call_later.return_value
+        message = engine.queue.put_nowait.call_args[0][0].msg
+        assert message.type == "note_on"
+        assert message.note == 60
+        loop.call_later.assert_called_once_with(
+            0.25, dispatcher.send_note_off, 60, 0, 2
+        )
+
+    def test_send_note_pair_without_queue(self):
+        """Test note_off is not scheduled when note_on fails."""
+        engine = MockMidiEngine(has_queue=False)
+        dispatcher = MidiDispatcher(engine)
+        loop = Mock()
+
+        assert dispatcher.send_note_pair(60, 100, 0.25, loop) is None
+        loop.call_later.assert_not_called()
+
     def test_enqueue_without_event_loop(self):
         """Test enqueueing without event loop."""
         engine = MockMidiEngine(has_queue=True, has_loop=False)
@@ -115,6 +141,87 @@ class TestMidiDispatcher:
         # Should use call_soon_threadsafe
         engine._loop.call_soon_threadsafe.assert_called_once()
 
+    def test_enqueue_on_engine_loop_is_direct(self):
+        """Calls made on the engine's own loop enqueue without a hop."""
+        loop = asyncio.new_event_loop()
+        engine = MockMidiEngine(has_queue=True)
+        engine._loop = loop
+        dispatcher = MidiDispatcher(engine)
+
+        async def send():
+            result = dispatcher.send_note_on(60, 100)
+            # put_nowait ran inline, before the loop got another turn
+            return result, engine.queue.put_nowait.call_count
+
+        try:
+            assert loop.run_until_complete(send()) == (True, 1)
+        finally:
+            loop.close()
+
+    def test_enqueue_off_engine_loop_hops(self):
+        """Calls made on another running loop go through call_soon_threadsafe."""
+        engine_loop = asyncio.new_event_loop()
+        other_loop = asyncio.new_event_loop()
+        engine = MockMidiEngine(has_queue=True)
+        engine._loop = engine_loop
+        dispatcher = MidiDispatcher(engine)
+
+        async def send():
+            return dispatcher.send_note_on(60, 100)
+
+        try:
+            assert other_loop.run_until_complete(send()) is True
+            # Nothing is enqueued until the engine loop takes its turn
+            assert engine.queue.put_nowait.call_count == 0
+            engine_loop.run_until_complete(asyncio.sleep(0))
+            assert engine.queue.put_nowait.call_count == 1
+        finally:
+            other_loop.close()
+            engine_loop.close()
+
+    def test_send_note_offs_single_hop(self):
+        """Several note_offs cross to the engine loop in one call."""
+        engine = MockMidiEngine(has_queue=True, has_loop=True)
+        engine._loop.call_soon_threadsafe = Mock()
+        dispatcher = MidiDispatcher(engine)
+
+        result = dispatcher.send_note_offs([60, 64, 67])
+
+        assert result is True
+        engine._loop.call_soon_threadsafe.assert_called_once()
+        put_all, queue, messages = engine._loop.call_soon_threadsafe.call_args[0]
+        put_all(queue, messages)
+        notes = [c[0][0].msg.note for c in queue.put_nowait.call_args_list]
+        assert notes == [60, 64, 67]
+
+    def test_send_note_ons_single_hop(self):
+        """Several note_ons share one velocity and one cross-loop hop."""
+        engine = MockMidiEngine(has_queue=True, has_loop=True)
+        engine._loop.call_soon_threadsafe = Mock()
+        dispatcher = MidiDispatcher(engine)
+
+        result = dispatcher.send_note_ons([64, 67], 90, channel=4)
+
+        assert result is True
+        engine._loop.call_soon_threadsafe.assert_called_once()
+        put_all, queue, messages = engine._loop.call_soon_threadsafe.call_args[0]
+        put_all(queue, messages)
+        sent = [c[0][0].msg for c in queue.put_nowait.call_args_list]
+        assert [(m.type, m.note, m.velocity, m.channel) for m in sent] == [
+            ("note_on", 64, 90, 4),
+            ("note_on", 67, 90, 4),
+        ]
+
+    def test_queue_created_after_dispatcher(self):
+        """A queue the engine creates later is picked up on first send."""
+        engine = MockMidiEngine(has_queue=False)
+        dispatcher = MidiDispatcher(engine)
+        assert dispatcher.send_note_on(60, 100) is False
+
+        engine.queue = Mock()
+        assert dispatcher.send_note_on(60, 100) is True
+        engine.queue.put_nowait.assert_called_once()
+
     def test_send_note_on_queue_error(self):
         """Test handling of queue errors."""
         engine = MockMidiEngine(has_queue=True)
@@ -180,3 +287,19 @@ class TestMidiDispatcher:
         args = engine.queue.put_nowait.call_args[0]
         wrapped = args[0]
         assert wrapped.is_arp is True
+
+    def test_repeated_messages_reuse_cached_wrapper(self):
+        """The same note event enqueues one shared, prebuilt wrapper."""
+        engine = MockMidiEngine(has_queue=True)
+        dispatcher = MidiDispatcher(engine)
+
+        dispatcher.send_note_off(64)
+        dispatcher.send_note_off(64)
+        dispatcher.send_note_on(64, 100)
+
+        first, second, note_on = [
+            c[0][0] for c in engine.queue.put_nowait.call_args_list
+        ]
+        assert first is second
+        assert note_on is not first
+        assert note_on.msg.type == "note_on"
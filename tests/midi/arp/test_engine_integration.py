@@ -56,7 +56,8 @@ class TestArpEngineBasic:
         assert engine._running is False
         assert engine._task is None
 
-    def test_start_stop(self, arp_state, mock_engine):
+    @pytest.mark.asyncio
+    async def test_start_stop(self, arp_state, mock_engine):
         """Test basic start and stop."""
         engine = ArpEngine(arp_state, mock_engine)
 
@@ -67,7 +68,8 @@ class TestArpEngineBasic:
         engine.stop()
         assert engine._running is False
 
-    def test_start_idempotent(self, arp_state, mock_engine):
+    @pytest.mark.asyncio
+    async def test_start_idempotent(self, arp_state, mock_engine):
         """Test that start is idempotent."""
         engine = ArpEngine(arp_state, mock_engine)
 
@@ -79,7 +81,38 @@ class TestArpEngineBasic:
 
         assert task1 == task2  # Should not create new task
 
-    def test_stop_idempotent(self, arp_state, mock_engine):
+    @pytest.mark.asyncio
+    async def test_start_captures_running_loop(self, arp_state, mock_engine):
+        """Without an explicit loop, start() binds to the running loop."""
+        engine = ArpEngine(arp_state, mock_engine)
+        assert engine._loop is None
+
+        engine.start()
+        assert engine._loop is asyncio.get_running_loop()
+        engine.stop()
+
+    def test_stop_releases_pending_notes(self, arp_state, mock_engine):
+        """Test stop cancels pending note_off timers and sends them now."""
+        loop = Mock()
+        loop.time.return_value = 0.0
+        handle = loop.call_later.return_value
+        handle.when.return_value = 1.0
+        arp_state.pattern.notes = [60]
+        engine = ArpEngine(arp_state, mock_engine, event_loop=loop)
+
+        engine._get_mode()
+        engine._process_step()
+        assert engine._pending_offs == {handle: 60}
+
+        engine.stop()
+
+        handle.cancel.assert_called_once()
+        assert engine._pending_offs == {}
+        sent = mock_engine.queue.put_nowait.call_args[0][0]
+        assert sent.msg.type == "note_off" and sent.msg.note == 60
+
+    @pytest.mark.asyncio
+    async def test_stop_idempotent(self, arp_state, mock_engine):
         """Test that stop is idempotent."""
         engine = ArpEngine(arp_state, mock_engine)
 
@@ -127,6 +160,36 @@ async def test_engine_respects_state_enabled(arp_state, mock_engine):
     assert mock_engine.queue.put_nowait.call_count == call_count
 
 
+@pytest.mark.asyncio
+async def test_step_deadlines_stay_on_grid(arp_state, mock_engine):
+    """Step deadlines are absolute: step k lands at anchor + k * step."""
+    arp_state.pattern.notes = [60]
+    arp_state.timing = TimingConfig(bpm=300, division="1/32")  # 25 ms steps
+    loop = asyncio.get_running_loop()
+    engine = ArpEngine(arp_state, mock_engine, event_loop=loop)
+
+    deadlines = []
+    call_at = loop.call_at
+
+    def record_call_at(when, callback, *args, **kwargs):
+        if callback == engine._fire_step:
+            deadlines.append(when)
+        return call_at(when, callback, *args, **kwargs)
+
+    loop.call_at = record_call_at
+    try:
+        engine.start()
+        await asyncio.sleep(0.3)
+        engine.stop()
+    finally:
+        del loop.call_at
+
+    assert len(deadlines) > 10
+    step = 0.025
+    for k, when in enumerate(deadlines):
+        assert abs(when - (deadlines[0] + k * step)) < 1e-6
+
+
 class TestArpEngineMode:
     """Tests for mode strategy integration."""
 
@@ -170,6 +233,49 @@ class TestArpEngineMode:
         assert mock_engine.queue.put_nowait.call_count > 0
 
 
+class TestArpEngineExpandedNotes:
+    """Tests for expanded note caching."""
+
+    def test_expanded_notes_cached(self, arp_state, mock_engine):
+        """Test expanded notes are reused while inputs are unchanged."""
+        arp_state.pattern.notes = [60, 64]
+        arp_state.octave = 2
+        engine = ArpEngine(arp_state, mock_engine, event_loop=Mock())
+
+        first = engine._build_expanded_notes()
+        assert list(first) == [60, 64, 72, 76]
+        assert engine._build_expanded_notes() is first
+
+    def test_expanded_notes_invalidated(self, arp_state, mock_engine):
+        """Test cache invalidates on note, octave and direction changes."""
+        arp_state.pattern.notes = [60]
+        arp_state.octave = 2
+        engine = ArpEngine(arp_state, mock_engine, event_loop=Mock())
+        assert list(engine._build_expanded_notes()) == [60, 72]
+
+        arp_state.pattern.notes.append(62)
+        assert list(engine._build_expanded_notes()) == [60, 62, 72, 74]
+
+        arp_state.octave_dir = "DOWN"
+        assert list(engine._build_expanded_notes()) == [48, 50, 60, 62]
+
+        arp_state.octave = 1
+        assert list(engine._build_expanded_notes()) == [60, 62]
+
+    def test_active_indices_follow_mode(self, arp_state, mock_engine):
+        """Test active indices are cached and rebuilt on mode change."""
+        arp_state.pattern.notes = [60, 62, 64]
+        engine = ArpEngine(arp_state, mock_engine, event_loop=Mock())
+
+        _, active = engine._get_cached_pattern()
+        assert list(active) == [0, 1, 2]
+        assert engine._get_cached_pattern()[1] is active
+
+        arp_state.mode = "DOWN"
+        _, active = engine._get_cached_pattern()
+        assert list(active) == [2, 1, 0]
+
+
 class TestArpEnginePreview:
     """Tests for preview functionality."""
 
@@ -182,6 +288,30 @@ class TestArpEnginePreview:
 
         # Should schedule preview task (exact behavior depends on event loop)
 
+    def test_preview_alternates_note_on_and_off(self, arp_state, mock_engine):
+        """Each preview note is released before the next one starts."""
+        arp_state.pattern.notes = [60, 64, 67]
+        loop = asyncio.new_event_loop()
+        try:
+            engine = ArpEngine(arp_state, mock_engine, event_loop=loop)
+            engine.preview(steps=3)
+            loop.run_until_complete(asyncio.sleep(4 * engine.PREVIEW_STEP))
+        finally:
+            loop.close()
+
+        sent = [
+            (call.args[0].msg.type, call.args[0].msg.note)
+            for call in mock_engine.queue.put_nowait.call_args_list
+        ]
+        assert sent == [
+            ("note_on", 60),
+            ("note_off", 60),
+            ("note_on", 64),
+            ("note_off", 64),
+            ("note_on", 67),
+            ("note_off", 67),
+        ]
+
 
 class TestArpEngineBackwardCompatibility:
     """Tests for backward compatibility methods."""
@@ -210,6 +340,20 @@ class TestArpEngineBackwardCompatibility:
         # Should return valid index
         assert 0 <= idx < len(engine._active_order)
 
+    def test_choose_index_follows_note_changes(self, arp_state, mock_engine):
+        """The legacy order is refreshed from the cache, not built once."""
+        arp_state.pattern.notes = [60, 64, 67]
+        engine = ArpEngine(arp_state, mock_engine, event_loop=Mock())
+        engine._choose_index()
+        order = engine._active_order
+
+        engine._choose_index()
+        assert engine._active_order is order  # cache hit, no rebuild
+
+        arp_state.pattern.notes = [60]
+        engine._choose_index()
+        assert list(engine._active_order) == [0]
+
 
 class TestArpEngineVelocityModes:
     """Tests for velocity mode handling."""
@@ -34,6 +34,13 @@ class TestCalculateVelocity:
             velocities.add(vel)
         assert len(velocities) > 1
 
+    def test_velocity_random_covers_range_ends(self):
+        """RANDOM mode can reach both RAMP_MIN_VEL and RAMP_MAX_VEL."""
+        state = ArpState(velocity=VelocityConfig(mode="RANDOM"))
+        seen = {self.producer.calculate_velocity(0, 1, state) for _ in range(3000)}
+        assert min(seen) == self.producer.RAMP_MIN_VEL
+        assert max(seen) == self.producer.RAMP_MAX_VEL
+
     def test_velocity_ramp_up(self):
         """RAMP_UP mode increases velocity with step index."""
         state = ArpState(velocity=VelocityConfig(mode="RAMP_UP"))
@@ -140,6 +147,36 @@ class TestApplyAccent:
         assert self.producer._apply_accent(0) == 0
 
 
+class TestProduceVelocity:
+    """Tests for produce_velocity method."""
+
+    def setup_method(self):
+        self.producer = NoteProducer()
+
+    def test_accent_applied_by_semitone(self):
+        """Accented semitones get the boost, others keep the base velocity."""
+        state = ArpState(
+            velocity=VelocityConfig(mode="FIXED", fixed_velocity=80),
+            pattern=PatternConfig(accents=[True] + [False] * 11),
+        )
+        assert self.producer.produce_velocity(72, 0, 4, state) == 100
+        assert self.producer.produce_velocity(74, 0, 4, state) == 80
+
+    def test_matches_separate_calls(self):
+        """Same result as calculate_velocity followed by the accent step."""
+        state = ArpState(
+            velocity=VelocityConfig(mode="RAMP_UP"),
+            pattern=PatternConfig(accents=[True, False] * 6),
+        )
+        for step_idx, note in enumerate(range(60, 72)):
+            expected = self.producer.calculate_velocity(step_idx, 12, state)
+            if self.producer.should_accent(note, state):
+                expected = self.producer._apply_accent(expected)
+            assert self.producer.produce_velocity(note, step_idx, 12, state) == (
+                expected
+            )
+
+
 class TestGetVelocityModes:
     """Tests for get_velocity_modes."""
 
@@ -55,6 +55,21 @@ class TestTimingConfig:
         config = TimingConfig(tempo_mul=10.0)
         assert config.tempo_mul == 4.0
 
+    def test_division_normalization(self):
+        """Divisions are upper-cased and unknown ones fall back to 1/8."""
+        config = TimingConfig(division="triplet")
+        assert config.division == "TRIPLET"
+
+        config.division = "1/3"
+        assert config.division == "1/8"
+
+        config.division = None
+        assert config.division == "1/8"
+
+        config.division = 8  # e.g. a number in a preset file
+        assert config.division == "1/8"
+        assert TimingConfig.from_dict({"division": 16}).division == "1/8"
+
     def test_to_dict(self):
         """Test serialization to dict."""
         config = TimingConfig(bpm=100, division="1/16", swing=25)
@@ -101,6 +116,18 @@ class TestVelocityConfig:
         config = VelocityConfig(mode="INVALID")
         assert config.mode == "ORIGINAL"
 
+    def test_mode_id_follows_assignment(self):
+        """mode_id tracks mode, including assignments after construction."""
+        config = VelocityConfig(mode="FIXED")
+        assert config.mode_id == 1
+
+        config.mode = "ACCENT_FIRST"
+        assert config.mode_id == 5
+
+        config.mode = "INVALID"
+        assert config.mode == "ORIGINAL"
+        assert config.mode_id == 0
+
     def test_velocity_clamping(self):
         """Test fixed velocity clamping."""
         config = VelocityConfig(fixed_velocity=200)
@@ -109,6 +136,15 @@ class TestVelocityConfig:
         config = VelocityConfig(fixed_velocity=-10)
         assert config.fixed_velocity == 0
 
+    def test_velocity_assignment_clamped(self):
+        """Direct assignments (as the GUI makes) are clamped to an int."""
+        config = VelocityConfig()
+        config.fixed_velocity = 140.7
+        assert config.fixed_velocity == 127
+
+        config.fixed_velocity = 64.9
+        assert config.fixed_velocity == 64
+
     def test_to_dict(self):
         """Test serialization."""
         config = VelocityConfig(mode="FIXED", fixed_velocity=80)
@@ -139,8 +175,8 @@ class TestPatternConfig:
         """Test pattern padding to 12 elements."""
         config = PatternConfig(mask=[True, False, True])
         assert len(config.mask) == 12
-        assert config.mask[:3] == [True, False, True]
-        assert config.mask[3:] == [False] * 9
+        assert config.mask[:3] == (True, False, True)
+        assert config.mask[3:] == (False,) * 9
 
     def test_pattern_truncation(self):
         """Test pattern truncation to 12 elements."""
@@ -165,7 +201,7 @@ class TestPatternConfig:
         mask = [True, False, True] + [False] * 9
         d = {"mask": mask, "accents": [False] * 12}
         config = PatternConfig.from_dict(d)
-        assert config.mask == mask
+        assert config.mask == tuple(mask)
 
 
 class TestArpState:
@@ -279,7 +315,7 @@ class TestArpState:
 
         assert state.timing.bpm == 150
         assert state.velocity.mode == "ACCENT_FIRST"
-        assert state.pattern.mask == [True, False] * 6
+        assert state.pattern.mask == (True, False) * 6
 
     def test_save_and_load(self):
         """Test save and load from file."""
@@ -305,6 +341,20 @@ class TestArpState:
             if os.path.exists(filepath):
                 os.unlink(filepath)
 
+    def test_save_compact_and_pretty(self, tmp_path):
+        """save writes compact JSON unless pretty output is requested."""
+        state = ArpState(mode="DOWN")
+        compact = tmp_path / "compact.json"
+        pretty = tmp_path / "pretty.json"
+
+        state.save(str(compact))
+        state.save(str(pretty), pretty=True)
+
+        assert b"\n" not in compact.read_bytes()
+        assert b'\n  "mode": "DOWN"' in pretty.read_bytes()
+        assert json.loads(compact.read_bytes()) == json.loads(pretty.read_bytes())
+        assert ArpState.load(str(compact)).mode == "DOWN"
+
     def test_load_nonexistent_file(self):
         """Test loading from nonexistent file returns default."""
         state = ArpState.load("/nonexistent/path/file.json")
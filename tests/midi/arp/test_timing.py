@@ -145,6 +145,25 @@ class TestTimingCalculator:
         assert metadata_odd.swing_delay > 0
         assert metadata_even.swing_delay < 0
 
+    def test_calculate_timing_cached_by_parity(self):
+        """Steps with the same parity share one cached result."""
+        first = self.calc.calculate_timing(120, "1/8", 30, step_number=1)
+        again = self.calc.calculate_timing(120, "1/8", 30, step_number=7)
+        even = self.calc.calculate_timing(120, "1/8", 30, step_number=2)
+
+        assert again is first
+        assert even is not first
+        assert even.swing_delay == -first.swing_delay
+
+    def test_calculate_timing_without_swing_ignores_parity(self):
+        """Unswung steps share one result regardless of step parity."""
+        even = self.calc.calculate_timing(120, "1/8", 0, step_number=0)
+        odd = self.calc.calculate_timing(120, "1/8", 0, step_number=1)
+
+        assert odd is even
+        assert even.swing_delay == 0.0
+        assert abs(even.total_sleep - 0.25) < 0.001
+
     def test_calculate_gate_duration(self):
         """Test note gate duration calculation."""
         # 120 BPM, 100% gate = full beat duration
@@ -51,7 +51,7 @@ class TestHarmonyEngine:
         )
 
         # Dispatcher should not be called
-        self.mock_dispatcher.send_note_on.assert_not_called()
+        self.mock_dispatcher.send_note_ons.assert_not_called()
 
     def test_process_melody_note_on_enabled(self):
         """Test note-on generates harmony when enabled."""
@@ -64,7 +64,7 @@ class TestHarmonyEngine:
 
         # Dispatcher should be called for harmony notes
         # Should generate harmony notes and send them
-        assert self.mock_dispatcher.send_note_on.called
+        assert self.mock_dispatcher.send_note_ons.called
 
     def test_process_melody_note_off_disabled(self):
         """Test note-off when harmony disabled does nothing."""
@@ -73,7 +73,7 @@ class TestHarmonyEngine:
         self.engine.process_melody_note_off(60, 0)
 
         # Dispatcher should not be called
-        self.mock_dispatcher.send_note_off.assert_not_called()
+        self.mock_dispatcher.send_note_offs.assert_not_called()
 
     def test_process_melody_note_off_enabled(self):
         """Test note-off sends note-offs for harmony notes."""
@@ -92,7 +92,7 @@ class TestHarmonyEngine:
         self.engine.process_melody_note_off(60, 0)
 
         # Dispatcher should be called for note-offs
-        assert self.mock_dispatcher.send_note_off.called
+        assert self.mock_dispatcher.send_note_offs.called
 
     def test_note_on_off_sequence(self):
         """Test a complete note-on/off sequence."""
@@ -103,11 +103,11 @@ class TestHarmonyEngine:
         self.engine.process_melody_note_on(
             60, 100, 0, scale_root=0, scale_type=ScaleType.MAJOR
         )
-        note_on_calls = self.mock_dispatcher.send_note_on.call_count
+        note_on_calls = self.mock_dispatcher.send_note_ons.call_count
 
         # Note off
         self.engine.process_melody_note_off(60, 0)
-        note_off_calls = self.mock_dispatcher.send_note_off.call_count
+        note_off_calls = self.mock_dispatcher.send_note_offs.call_count
 
         # Should have equal numbers of on and off calls
         assert note_on_calls > 0
@@ -122,7 +122,7 @@ class TestHarmonyEngine:
         self.engine.process_melody_note_on(
             60, 100, 0, scale_root=0, scale_type=ScaleType.MAJOR
         )
-        calls_c_major = len(self.mock_dispatcher.send_note_on.call_args_list)
+        calls_c_major = len(self.mock_dispatcher.send_note_ons.call_args_list)
 
         # Reset
         self.mock_dispatcher.reset_mock()
@@ -131,7 +131,7 @@ class TestHarmonyEngine:
         self.engine.process_melody_note_on(
             60, 100, 0, scale_root=9, scale_type=ScaleType.MINOR
         )
-        calls_a_minor = len(self.mock_dispatcher.send_note_on.call_args_list)
+        calls_a_minor = len(self.mock_dispatcher.send_note_ons.call_args_list)
 
         # Both should generate harmony notes
         assert calls_c_major > 0
@@ -146,7 +146,7 @@ class TestHarmonyEngine:
         self.engine.process_melody_note_on(
             60, 100, 0, scale_root=0, scale_type=ScaleType.MAJOR
         )
-        calls_major = len(self.mock_dispatcher.send_note_on.call_args_list)
+        calls_major = len(self.mock_dispatcher.send_note_ons.call_args_list)
 
         # Reset
         self.mock_dispatcher.reset_mock()
@@ -155,7 +155,7 @@ class TestHarmonyEngine:
         self.engine.process_melody_note_on(
             60, 100, 0, scale_root=0, scale_type=ScaleType.MINOR
         )
-        calls_minor = len(self.mock_dispatcher.send_note_on.call_args_list)
+        calls_minor = len(self.mock_dispatcher.send_note_ons.call_args_list)
 
         # Both should generate harmony notes
         assert calls_major > 0
@@ -172,10 +172,8 @@ class TestHarmonyEngine:
         )
 
         # Should respect voice limit
-        assert (
-            self.mock_dispatcher.send_note_on.call_count
-            <= self.engine.state.voice_limit + 1
-        )  # +1 for melody
+        notes = self.mock_dispatcher.send_note_ons.call_args[0][0]
+        assert len(notes) <= self.engine.state.voice_limit
 
     def test_multiple_melody_notes(self):
         """Test handling multiple melody notes."""
@@ -186,17 +184,47 @@ class TestHarmonyEngine:
         self.engine.process_melody_note_on(
             60, 100, 0, scale_root=0, scale_type=ScaleType.MAJOR
         )
-        first_call_count = self.mock_dispatcher.send_note_on.call_count
+        first_call_count = self.mock_dispatcher.send_note_ons.call_count
 
         # Second note (before first note off, polyphonic)
         self.engine.process_melody_note_on(
             64, 100, 0, scale_root=0, scale_type=ScaleType.MAJOR
         )
-        second_call_count = self.mock_dispatcher.send_note_on.call_count
+        second_call_count = self.mock_dispatcher.send_note_ons.call_count
 
         # Should have additional calls for second note
         assert second_call_count > first_call_count
 
+    def test_harmony_notes_sent_in_one_batch(self):
+        """All harmony notes of a melody note go out in a single call."""
+        self.engine.update_state(
+            HarmonyState(enabled=True, intervals_above=[4, 7], intervals_below=[])
+        )
+
+        self.engine.process_melody_note_on(
+            60, 100, 3, scale_root=0, scale_type=ScaleType.MAJOR
+        )
+        self.mock_dispatcher.send_note_ons.assert_called_once_with((64, 67), 100, 3)
+
+        self.engine.process_melody_note_off(60, 3)
+        self.mock_dispatcher.send_note_offs.assert_called_once_with((64, 67), 3)
+
+    def test_panic_releases_all_voices_per_channel(self):
+        """Panic sends one batch of note-offs per MIDI channel."""
+        self.engine.update_state(
+            HarmonyState(enabled=True, intervals_above=[4], intervals_below=[])
+        )
+        for note in (60, 62):
+            self.engine.process_melody_note_on(
+                note, 100, 0, scale_root=0, scale_type=ScaleType.MAJOR
+            )
+
+        self.engine.panic()
+
+        calls = self.mock_dispatcher.send_note_offs.call_args_list
+        assert [c[0][1] for c in calls] == list(range(16))
+        assert all(sorted(c[0][0]) == [64, 67] for c in calls)
+
     def test_chromatic_scale_harmony(self):
         """Test harmony generation in chromatic scale."""
         self.engine.state.enabled = True
@@ -207,7 +235,7 @@ class TestHarmonyEngine:
         )
 
         # Should generate harmony notes
-        assert self.mock_dispatcher.send_note_on.called
+        assert self.mock_dispatcher.send_note_ons.called
 
 
 class TestHarmonyEngineVelocityAndChannel:
@@ -229,9 +257,9 @@ class TestHarmonyEngineVelocityAndChannel:
             60, velocity, 0, scale_root=0, scale_type=ScaleType.MAJOR
         )
 
-        # Check that send_note_on was called with correct velocity
-        if self.mock_dispatcher.send_note_on.called:
-            call_args = self.mock_dispatcher.send_note_on.call_args_list[-1]
+        # Check that send_note_ons was called with correct velocity
+        if self.mock_dispatcher.send_note_ons.called:
+            call_args = self.mock_dispatcher.send_note_ons.call_args_list[-1]
             # Velocity is second argument
             expected_velocity = int((velocity * 100) / 100)
             assert call_args[0][1] == expected_velocity
@@ -246,8 +274,8 @@ class TestHarmonyEngineVelocityAndChannel:
             60, velocity, 0, scale_root=0, scale_type=ScaleType.MAJOR
         )
 
-        if self.mock_dispatcher.send_note_on.called:
-            call_args = self.mock_dispatcher.send_note_on.call_args_list[-1]
+        if self.mock_dispatcher.send_note_ons.called:
+            call_args = self.mock_dispatcher.send_note_ons.call_args_list[-1]
             expected_velocity = int((velocity * 50) / 100)
             assert call_args[0][1] == expected_velocity
 
@@ -260,8 +288,8 @@ class TestHarmonyEngineVelocityAndChannel:
             60, 100, channel, scale_root=0, scale_type=ScaleType.MAJOR
         )
 
-        # Check that send_note_on was called with correct channel
-        if self.mock_dispatcher.send_note_on.called:
-            call_args = self.mock_dispatcher.send_note_on.call_args_list[-1]
+        # Check that send_note_ons was called with correct channel
+        if self.mock_dispatcher.send_note_ons.called:
+            call_args = self.mock_dispatcher.send_note_ons.call_args_list[-1]
             # Channel is third argument
             assert call_args[0][2] == channel
@@ -279,3 +279,46 @@ class TestBidirectionalHarmony:
         assert len(harmony) == 4
         # All should be valid MIDI notes
         assert all(0 <= note <= 127 for note in harmony)
+
+    def test_generate_harmony_above_then_below(self):
+        """Upward harmonies come first, and direct assignments take effect."""
+        generator = HarmonyGenerator(intervals_above=[4], intervals_below=[5])
+
+        harmony = generator.generate_harmony(
+            60, scale_root=0, scale_type=ScaleType.MAJOR
+        )
+        assert harmony == [64, 55]
+
+        generator.intervals_below = [12, 24]  # 20-24 is out of range
+        harmony = generator.generate_harmony(
+            20, scale_root=0, scale_type=ScaleType.MAJOR
+        )
+        assert harmony == [24, 9]
+
+    def test_generate_harmony_batch_matches_single(self):
+        """Each batch row, masked by validity, equals the per-note result."""
+        generator = HarmonyGenerator(intervals_above=[4, 7], intervals_below=[12])
+        melody = [5, 60, 61, 125]
+
+        snapped, valid = generator.generate_harmony_batch(
+            melody, scale_root=2, scale_type=ScaleType.DORIAN
+        )
+
+        assert snapped.shape == valid.shape == (4, 3)
+        for row, note in enumerate(melody):
+            expected = generator.generate_harmony(
+                note, scale_root=2, scale_type=ScaleType.DORIAN
+            )
+            assert snapped[row][valid[row]].tolist() == expected
+
+    def test_intervals_clamped_however_assigned(self):
+        """Constructor and direct assignment clamp intervals like the setters."""
+        generator = HarmonyGenerator(intervals_above=[0, 30], intervals_below=[-5])
+        assert generator.intervals_above == [1, 24]
+        assert generator.intervals_below == [1]
+
+        generator.intervals_below = [200]
+        assert generator.intervals_below == [24]
+        assert generator.generate_harmony(
+            60, scale_root=0, scale_type=ScaleType.CHROMATIC
+        ) == [61, 84, 36]
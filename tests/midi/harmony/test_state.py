@@ -0,0 +1,31 @@
+"""Tests for HarmonyState persistence."""
+
+from src.midi.harmony.state import HarmonyState
+
+
+class TestHarmonyState:
+    """Tests for HarmonyState save/load."""
+
+    def test_save_load_round_trip(self, tmp_path):
+        """Saved state loads back unchanged."""
+        path = tmp_path / "harmony.json"
+        state = HarmonyState(enabled=True, intervals_above=[4, 7], voice_limit=3)
+
+        state.save(path)
+
+        assert HarmonyState.load(path) == state
+
+    def test_load_missing_or_malformed_file_gives_defaults(self, tmp_path):
+        """A missing or corrupt file loads the default state."""
+        path = tmp_path / "harmony.json"
+        assert HarmonyState.load(path) == HarmonyState()
+
+        path.write_bytes(b"{not json")
+        assert HarmonyState.load(path) == HarmonyState()
+
+    def test_load_non_object_json_gives_defaults(self, tmp_path):
+        """Valid JSON that is not an object loads the default state."""
+        path = tmp_path / "harmony.json"
+        for payload in (b"[1, 2]", b"null", b"42"):
+            path.write_bytes(payload)
+            assert HarmonyState.load(path) == HarmonyState()
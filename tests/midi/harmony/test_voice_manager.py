@@ -0,0 +1,40 @@
+"""Tests for VoiceManager voice allocation."""
+
+from src.midi.harmony.voice_manager import VoiceManager
+
+
+class TestVoiceManager:
+    """Tests for voice allocation and release."""
+
+    def test_allocate_truncates_to_free_slots(self):
+        """Only as many notes as free voices are allocated."""
+        manager = VoiceManager(max_voices=3)
+
+        assert manager.allocate_voices(60, [64, 67]) == (64, 67)
+        assert manager.allocate_voices(62, [65, 69]) == (65,)
+        assert manager.allocate_voices(64, [67]) == ()
+        assert manager.voice_count == 3
+
+    def test_fitting_tuple_is_stored_as_is(self):
+        """A tuple that fits is kept without copying."""
+        manager = VoiceManager(max_voices=4)
+        notes = (64, 67)
+
+        assert manager.allocate_voices(60, notes) is notes
+
+    def test_deallocate_releases_voices(self):
+        """Releasing a melody note frees its voices; unknown notes are no-ops."""
+        manager = VoiceManager(max_voices=4)
+        manager.allocate_voices(60, [64, 67])
+
+        assert manager.deallocate_voices(60) == (64, 67)
+        assert manager.deallocate_voices(60) == ()
+        assert manager.voice_count == 0
+
+    def test_get_active_harmonies(self):
+        """Active harmonies are the allocated tuple, or () for unknown notes."""
+        manager = VoiceManager(max_voices=4)
+        manager.allocate_voices(60, [64, 67])
+
+        assert manager.get_active_harmonies(60) == (64, 67)
+        assert manager.get_active_harmonies(62) == ()
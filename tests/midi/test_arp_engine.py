@@ -54,9 +54,20 @@ def test_arp_state_pattern_mask_mutation():
     state = ArpState()
     assert state.pattern.mask[0] is True
 
-    state.pattern.mask[0] = False
+    state.pattern.mask_bits ^= 1 << 0
     assert state.pattern.mask[0] is False
 
-    state.pattern.mask[5] = False
+    state.pattern.mask_bits ^= 1 << 5
     active = [i for i, v in enumerate(state.pattern.mask) if v]
     assert len(active) == 10  # 12 - 2 disabled
+
+
+def test_arp_state_pattern_mask_bits():
+    """Test that list views and bitmasks stay in sync."""
+    state = ArpState()
+    assert state.pattern.mask_bits == 0xFFF
+    assert state.pattern.accent_bits == 0
+
+    state.pattern.accents = [True, False, True]
+    assert state.pattern.accent_bits == 0b101
+    assert state.pattern.to_dict()["accents"] == [True, False, True] + [False] * 9
@@ -0,0 +1,55 @@
+"""Tests for MidiEngine module."""
+
+import asyncio
+
+import mido
+import pytest
+from unittest.mock import Mock
+
+from src.midi.engine import MidiEngine
+
+
+@pytest.mark.asyncio
+async def test_consume_queue_drains_burst_in_one_wakeup():
+    """Messages queued together are all sent before the consumer yields."""
+    processor = Mock()
+    processor.process.side_effect = lambda msg: msg
+    engine = MidiEngine(processor)
+    engine.output = Mock()
+    engine.queue = asyncio.Queue()
+    engine._running = True
+
+    consumer = asyncio.create_task(engine._consume_queue())
+    await asyncio.sleep(0)  # consumer is now waiting on get()
+
+    for note in (60, 64, 67):
+        engine.queue.put_nowait(mido.Message("note_on", note=note))
+    await asyncio.sleep(0)  # a single turn for the consumer
+
+    sent = [c.args[0].note for c in engine.output.send.call_args_list]
+    assert sent == [60, 64, 67]
+    assert engine.queue.empty()
+
+    consumer.cancel()
+    await asyncio.gather(consumer, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_consume_queue_keeps_going_after_error():
+    """A message that fails to process does not stop the rest of the burst."""
+    processor = Mock()
+    processor.process.side_effect = [ValueError("bad"), "ok"]
+    engine = MidiEngine(processor)
+    engine.output = Mock()
+    engine.queue = asyncio.Queue()
+    engine._running = True
+
+    engine.queue.put_nowait("first")
+    engine.queue.put_nowait("second")
+    consumer = asyncio.create_task(engine._consume_queue())
+    await asyncio.sleep(0)
+
+    engine.output.send.assert_called_once_with("ok")
+
+    consumer.cancel()
+    await asyncio.gather(consumer, return_exceptions=True)
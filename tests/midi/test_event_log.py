@@ -0,0 +1,46 @@
+"""Tests for MIDI event log formatting."""
+
+from datetime import datetime, timedelta
+
+import mido
+
+from src.midi.event_log import Event, EventLog, midi_note_to_name
+
+
+def test_midi_note_to_name():
+    assert midi_note_to_name(0) == "C-1"
+    assert midi_note_to_name(60) == "C4"
+    assert midi_note_to_name(61) == "C#4"
+    assert midi_note_to_name(127) == "G9"
+    assert midi_note_to_name(128) == "N128"
+    assert midi_note_to_name(-1) == "N-1"
+
+
+def test_format_time_matches_strftime():
+    event = Event("in", mido.Message("note_on", note=60, velocity=100))
+    for ts in (
+        datetime(2024, 1, 1, 12, 34, 56, 789123),
+        datetime(2024, 1, 1, 12, 34, 56, 1000),
+        datetime(2024, 1, 1, 12, 34, 57, 0),
+    ):
+        event.timestamp = ts
+        assert event.format_time() == ts.strftime("%H:%M:%S.%f")[:-3]
+
+
+def test_event_timestamp_is_wall_clock():
+    now = datetime.now()
+    event = Event("out", mido.Message("note_off", note=60))
+
+    assert not hasattr(event, "__dict__")
+    # Monotonic time mapped onto the wall clock (tolerates clock slew)
+    assert abs(event.timestamp - now) < timedelta(seconds=1)
+
+
+def test_get_events_limit_returns_newest_in_order():
+    log = EventLog(max_events=10)
+    for note in range(60, 72):
+        log.add_event("in", mido.Message("note_on", note=note))
+
+    assert [e.msg.note for e in log.get_events()] == list(range(62, 72))
+    assert [e.msg.note for e in log.get_events(limit=3)] == [69, 70, 71]
+    assert len(log.get_events(limit=50)) == 10
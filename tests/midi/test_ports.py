@@ -0,0 +1,37 @@
+"""Tests for PortManager module."""
+
+import pytest
+
+from src.midi.ports import PortManager
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    names = ["IAC Driver Bus 1", "Synth Pro", "synth", "USB MIDI Synth"]
+    monkeypatch.setattr("src.midi.ports.mido.get_output_names", lambda: names)
+    return PortManager()
+
+
+def test_find_output_port_prefers_exact_match(manager):
+    assert manager.find_output_port("SYNTH") == "synth"
+
+
+def test_find_output_port_substring_in_port_order(manager):
+    assert manager.find_output_port("bus") == "IAC Driver Bus 1"
+    assert manager.find_output_port("midi syn") == "USB MIDI Synth"
+    assert manager.find_output_port("missing") is None
+
+
+def test_filter_by_patterns_keeps_priority_and_case(manager):
+    assert manager.filter_by_patterns(["usb", "SYNTH"]) == [
+        "USB MIDI Synth",
+        "Synth Pro",
+        "synth",
+    ]
+
+
+@pytest.mark.parametrize("system, kept", [("Linux", 1), ("Darwin", 2)])
+def test_filter_inputs_drops_midi_through_on_linux(manager, system, kept):
+    manager.system = system
+    names = ["Midi Through Port-0", "Keystation"]
+    assert manager.filter_inputs(names) == names[-kept:]
@@ -2,6 +2,7 @@
 
 import pytest
 import mido
+from unittest.mock import Mock
 from src.midi.processor import MidiProcessor
 from src.midi.message_wrapper import MidiMessageWrapper
 from src.midi.scales import ScaleType
@@ -117,6 +118,59 @@ class TestMidiProcessor:
         assert result is None  # Dropped
         assert 60 in processor.arp_state.held_notes  # But held notes updated
 
+    def test_arp_pattern_rebuilt_only_when_held_notes_change(self):
+        """Repeated note_on/note_off for the same note leave the pattern as is."""
+        processor = MidiProcessor()
+        processor.arp_enabled = True
+        processor.process(mido.Message("note_on", note=64, velocity=100))
+        processor.process(mido.Message("note_on", note=60, velocity=100))
+        notes = processor.arp_state.pattern.notes
+        assert notes == [60, 64]
+
+        processor.process(mido.Message("note_on", note=60, velocity=90))
+        processor.process(mido.Message("note_off", note=62))
+        assert processor.arp_state.pattern.notes is notes
+
+        processor.process(mido.Message("note_off", note=60))
+        assert processor.arp_state.pattern.notes == [64]
+
+    def test_arp_pattern_stays_sorted_as_notes_change(self):
+        """Pattern notes track held notes in sorted order, even after a reload."""
+        processor = MidiProcessor()
+        processor.arp_enabled = True
+        for note in (67, 60, 72, 64):
+            processor.process(mido.Message("note_on", note=note, velocity=100))
+        assert processor.arp_state.pattern.notes == [60, 64, 67, 72]
+
+        processor.process(mido.Message("note_off", note=67))
+        assert processor.arp_state.pattern.notes == [60, 64, 72]
+
+        processor.arp_state.pattern.notes = [48]  # e.g. a loaded preset
+        processor.process(mido.Message("note_on", note=62, velocity=100))
+        assert processor.arp_state.pattern.notes == [60, 62, 64, 72]
+
+        processor.arp_state.pattern.notes = []
+        processor._update_arp_pattern()  # full resync, as the pattern tab does
+        assert processor.arp_state.pattern.notes == [60, 62, 64, 72]
+
+    def test_arp_pattern_resynced_when_same_size_but_different(self):
+        """A pattern with the right length but the wrong notes is rebuilt."""
+        processor = MidiProcessor()
+        processor.arp_enabled = True
+        processor.arp_state.held_notes = {60, 67}
+        processor.arp_state.pattern.notes = [60, 64]
+
+        processor.process(mido.Message("note_on", note=72, velocity=100))
+        assert processor.arp_state.pattern.notes == [60, 67, 72]
+
+        processor.arp_state.pattern.notes = [72, 67, 60]  # unsorted
+        processor.process(mido.Message("note_on", note=60, velocity=100))
+        assert processor.arp_state.pattern.notes == [60, 67, 72]
+
+        processor.arp_state.pattern.notes = [60, 64, 72]
+        processor.process(mido.Message("note_off", note=67))
+        assert processor.arp_state.pattern.notes == [60, 72]
+
     def test_scale_disabled_note_passes_unchanged(self):
         """Test notes pass unchanged when scale disabled."""
         processor = MidiProcessor()
@@ -218,3 +272,116 @@ class TestMidiProcessor:
 
         assert result is not None
         assert getattr(result, "channel", None) == 2
+
+    def test_output_channel_applies_to_channel_messages_only(self):
+        """Channel messages are moved to output_channel; others pass as-is."""
+        processor = MidiProcessor()
+        processor.output_channel = 9
+        sysex = mido.Message("sysex", data=[1, 2, 3])
+
+        for msg in (
+            mido.Message("note_on", note=60, velocity=100),
+            mido.Message("pitchwheel", pitch=100),
+            mido.Message("program_change", program=5),
+        ):
+            assert processor.process(msg).channel == 9
+        assert processor.process(sysex) is sysex
+
+    def test_outgoing_events_logged_with_channel(self):
+        """Forwarded messages are logged with their channel, or 0 if none."""
+        event_log = Mock()
+        processor = MidiProcessor(event_log=event_log)
+        note = mido.Message("note_on", note=60, velocity=100, channel=4)
+        sysex = mido.Message("sysex", data=[1, 2, 3])
+
+        processor.process(note)
+        event_log.add_event.assert_called_with("out", note, 4)
+        processor.process(sysex)
+        event_log.add_event.assert_called_with("out", sysex, 0)
+
+    def test_settings_shared_with_app_state(self):
+        """Processor settings read and write the app's PerformanceState."""
+        processor = MidiProcessor()
+        perf = processor.app_state.performance
+
+        processor.transpose = "3"
+        perf.octave = 1
+        msg = mido.Message("note_on", note=60, velocity=100)
+
+        assert perf.transpose == 3
+        assert processor.octave == 1
+        assert processor.process(msg).note == 75
+        assert not hasattr(perf, "__dict__")
+
+    def test_transpose_shift_tracks_both_settings(self):
+        """Transpose and octave changes made anywhere move notes by the sum."""
+        processor = MidiProcessor()
+        perf = processor.app_state.performance
+        msg = mido.Message("note_on", note=60, velocity=100)
+
+        processor.octave = -1
+        perf.transpose = 2
+        assert perf.shift == -10
+        assert processor.process(msg).note == 50
+
+        processor.transpose = 0
+        perf.octave = 0
+        assert processor.process(msg) is msg
+
+    def test_scale_snap_follows_scale_changes(self):
+        """Snapping uses the scale set most recently through the setters."""
+        processor = MidiProcessor()
+        processor.scale_enabled = True
+        msg = mido.Message("note_on", note=63, velocity=100)  # D#4
+
+        assert processor.process(msg).note == 64  # E in C major
+
+        processor.scale_type = ScaleType.MINOR
+        assert processor.process(msg).note == 63  # Eb is in C minor
+
+        processor.scale_root = 2  # D minor
+        assert processor.process(msg).note == 64
+
+    def test_clock_tempo_uses_last_quarter_note(self, monkeypatch):
+        """External clock tempo averages only the latest 24 intervals."""
+        processor = MidiProcessor()
+        processor.arp_state.external_sync = True
+        clock = mido.Message("clock")
+        now = [0.0]
+        monkeypatch.setattr("src.midi.processor.time.time", lambda: now[0])
+
+        for _ in range(40):  # 120 BPM: 0.5 s per quarter
+            processor.process(clock)
+            now[0] += 0.5 / 24
+        for _ in range(24):  # 100 BPM replaces the whole window
+            processor.process(clock)
+            now[0] += 0.6 / 24
+        processor.process(clock)
+
+        assert len(processor.clock_intervals) == 24
+        assert processor.arp_state.timing.bpm == 100
+
+    def test_timing_messages_pass_through_uncopied(self):
+        """Clock and active sensing are forwarded as-is and still logged."""
+        event_log = Mock()
+        processor = MidiProcessor(event_log=event_log)
+        processor.output_channel = 3
+        processor.transpose = 5
+
+        for msg in (mido.Message("clock"), mido.Message("active_sensing")):
+            assert processor.process(msg) is msg
+            event_log.add_event.assert_called_with("out", msg, 0)
+
+    def test_message_copied_only_when_changed(self):
+        """Untouched messages are forwarded as-is; changed ones are copies."""
+        processor = MidiProcessor()
+        cc = mido.Message("control_change", control=7, value=100)
+        note = mido.Message("note_on", note=60, velocity=100)
+
+        assert processor.process(cc) is cc
+        assert processor.process(note) is note
+
+        processor.transpose = 2
+        result = processor.process(note)
+        assert result is not note
+        assert (result.note, note.note) == (62, 60)
@@ -0,0 +1,43 @@
+"""Tests for scale snapping."""
+
+import numpy as np
+import pytest
+
+from src.midi.scales import (
+    ScaleType,
+    build_snap_table,
+    snap_note_to_scale,
+    snap_notes_bulk,
+)
+
+
+@pytest.mark.parametrize(
+    "note, root, scale_type, expected",
+    [
+        (61, 0, ScaleType.MAJOR, 62),  # C# ties between C and D: upward
+        (66, 0, ScaleType.MAJOR, 67),  # F# ties between F and G: upward
+        (71, 0, ScaleType.MAJOR, 71),  # B is in the scale
+        (60, 2, ScaleType.MAJOR, 61),  # C ties between B and C# in D major
+        (127, 1, ScaleType.MAJOR, 126),  # G9 (not in Db major) snaps down
+        (0, 2, ScaleType.MAJOR, 1),  # B below C-1 is out of range
+        (70, 0, ScaleType.CHROMATIC, 70),
+    ],
+)
+def test_snap_note_to_scale(note, root, scale_type, expected):
+    assert snap_note_to_scale(note, root, scale_type) == expected
+
+
+def test_snap_table_matches_snap_note_to_scale():
+    table = build_snap_table(9, ScaleType.MINOR)
+    assert list(table) == [
+        snap_note_to_scale(n, 9, ScaleType.MINOR) for n in range(128)
+    ]
+
+
+def test_snap_notes_bulk_matches_single():
+    notes = np.arange(128).reshape(8, 16)
+    snapped = snap_notes_bulk(notes, 4, ScaleType.DORIAN)
+    assert snapped.shape == (8, 16)
+    assert snapped.ravel().tolist() == [
+        snap_note_to_scale(n, 4, ScaleType.DORIAN) for n in range(128)
+    ]
@@ -160,6 +160,32 @@ class TestPattern:
         events_at_100 = pattern.events_at_tick(100)
         assert len(events_at_100) == 0
 
+    def test_events_at_tick_index(self):
+        """Tick lookups cover constructed, added and cleared events."""
+        first = PatternEvent(480, mido.Message("note_on", note=60))
+        pattern = Pattern(events=[first])
+        pattern.add_event(480, mido.Message("note_on", note=64))
+
+        assert [e.message.note for e in pattern.events_at_tick(480)] == [60, 64]
+
+        pattern.clear()
+        assert len(pattern.events_at_tick(480)) == 0
+
+    def test_events_in_range_and_tick_bounds(self):
+        """Range queries and first/last tick follow the sorted ticks."""
+        pattern = Pattern()
+        assert pattern.get_first_tick() is None
+        for tick, note in [(960, 64), (0, 60), (480, 62), (960, 67)]:
+            pattern.add_event(tick, mido.Message("note_on", note=note))
+
+        assert [e.message.note for e in pattern.events_in_range(480, 961)] == [
+            62,
+            64,
+            67,
+        ]
+        assert pattern.events_in_range(1, 480) == []
+        assert (pattern.get_first_tick(), pattern.get_last_tick()) == (0, 960)
+
     def test_quantize_event(self):
         """Test quantization of ticks to grid."""
         pattern = Pattern()
@@ -176,6 +202,38 @@ class TestPattern:
         # 240 stays at 240
         assert pattern.quantize_event(240, grid) == 240
 
+    def test_pattern_event_to_dict_fields_by_type(self):
+        """Each message type saves only the fields it has."""
+        cc = PatternEvent(0, mido.Message("control_change", control=7, value=90))
+        clock = PatternEvent(10, mido.Message("clock"))
+
+        assert cc.to_dict() == {
+            "tick": 0,
+            "message": {
+                "type": "control_change",
+                "channel": 0,
+                "control": 7,
+                "value": 90,
+            },
+        }
+        assert clock.to_dict() == {"tick": 10, "message": {"type": "clock"}}
+
+    def test_to_midi_file_orders_events_by_tick(self):
+        """Export writes events in tick order as delta times."""
+        pattern = Pattern()
+        pattern.add_event(480, mido.Message("note_off", note=60))
+        pattern.add_event(0, mido.Message("note_on", note=60))
+        pattern.add_event(480, mido.Message("note_on", note=64))
+
+        track = pattern.to_midi_file(120, 4, 4).tracks[0]
+        notes = [(m.type, m.note, m.time) for m in track if not m.is_meta]
+
+        assert notes == [
+            ("note_on", 60, 0),
+            ("note_off", 60, 480),
+            ("note_on", 64, 0),
+        ]
+
     def test_pattern_serialization(self):
         """Test to_dict and from_dict preserve pattern."""
         pattern = Pattern()
@@ -467,6 +525,54 @@ class TestInternalClock:
         """Test PPQN constant."""
         assert InternalClock.PPQN == 960
 
+    def test_dispatch_ticks_fires_beats_and_bar(self, clock, mock_sequencer):
+        """A frame's ticks fire every beat and wrap the bar (3/4, one bar)."""
+        mock_sequencer.state.on_time_signature_changed(3, 4)
+        clock._dispatch_ticks(2880)
+
+        assert mock_sequencer._on_tick.call_count == 2880
+        assert [c.args[0] for c in mock_sequencer._on_beat.call_args_list] == [
+            1,
+            2,
+            0,
+        ]
+        mock_sequencer._on_bar_start.assert_called_once()
+        assert mock_sequencer.state.current_tick == 0
+
+    @pytest.mark.asyncio
+    async def test_run_clock_follows_tick_deadlines(
+        self, clock, mock_sequencer, monkeypatch
+    ):
+        """Half a second at 120 BPM plays tick 0 plus 960 ticks, in batches."""
+        now = [100.0]
+        sleeps = []
+        woken_at = []  # clock time of each dispatch pass
+
+        async def fake_sleep(seconds):
+            woken_at.append(now[0])
+            sleeps.append(seconds)
+            now[0] += seconds * 1.1  # oversleep; deadlines absorb the jitter
+            if now[0] >= 100.5:
+                clock._is_running = False
+
+        monkeypatch.setattr("src.midi.sequencer.clock.monotonic", lambda: now[0])
+        monkeypatch.setattr("src.midi.sequencer.clock.asyncio.sleep", fake_sleep)
+        clock._is_running = True
+
+        await clock._run_clock()
+
+        elapsed_ticks = int((woken_at[-1] - 100.0) * 1920)
+        assert elapsed_ticks > 900
+        assert mock_sequencer._on_tick.call_count == elapsed_ticks + 1
+        assert len(sleeps) < elapsed_ticks / 2
+        assert min(sleeps) >= InternalClock.MIN_SLEEP
+
+    def test_ticks_per_beat(self):
+        """Beat length is an int tick count for power-of-two denominators."""
+        assert InternalClock._ticks_per_beat(8) == 480
+        assert isinstance(InternalClock._ticks_per_beat(16), int)
+        assert InternalClock._ticks_per_beat(7) == pytest.approx(3840 / 7)
+
 
 class TestSequencerIntegration:
     """Integration tests for sequencer with engine."""